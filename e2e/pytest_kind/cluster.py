@@ -12,7 +12,7 @@ from typing import Any, Callable, Generator, Optional, Union
 import requests
 from kubernetes import config
 
-from paka.cluster.kubectl import KUBECTL_VERSION, ensure_kubectl_by_path
+from paka.cluster.kubectl import ensure_kubectl_by_path, get_kubectl_version
 from paka.k8s.utils import setup_port_forward
 from paka.utils import get_gh_release_latest_version
 
@@ -53,11 +53,11 @@ class KindCluster:
 
         if self.system == "windows":
             self.kubectl_path = kubectl_path or (
-                self.path / f"kubectl-{KUBECTL_VERSION}" / "kubectl.exe"
+                self.path / f"kubectl-{get_kubectl_version()}" / "kubectl.exe"
             )
         else:
             self.kubectl_path = kubectl_path or (
-                self.path / f"kubectl-{KUBECTL_VERSION}" / "kubectl"
+                self.path / f"kubectl-{get_kubectl_version()}" / "kubectl"
             )
 
     def ensure_kind(self) -> None:
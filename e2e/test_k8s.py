@@ -24,6 +24,7 @@ from paka.k8s.function.service import (
 from paka.k8s.model_group.service import (
     cleanup_staled_model_group_services,
     create_model_group_service,
+    save_model_to_store,
 )
 from paka.utils import kubify_name
 
@@ -245,7 +246,9 @@ def test_create_model_group(kind_cluster: KindCluster) -> None:
     ctx = Context()
     ctx.set_config(config)
     ctx.set_kubeconfig(json.dumps(kubeconfig_json))
+    k8s_config.load_kube_config_from_dict(kubeconfig_json)
 
+    save_model_to_store(ctx, model_group)
     create_model_group_service(ctx, ctx.namespace, model_group)
 
     core_v1_api = client.CoreV1Api()
@@ -342,7 +345,7 @@ def test_create_functions(kind_cluster: KindCluster) -> None:
 @pytest.mark.order(4)
 def test_destroy_model_group() -> None:
     (config, cloud_config) = get_config()
-    cloud_config.modelGroups = []
+    cloud_config = cloud_config.model_copy(update={"modelGroups": []})
 
     ctx = Context()
     ctx.set_config(config)
@@ -352,9 +355,6 @@ def test_destroy_model_group() -> None:
         [mg.name for mg in cloud_config.modelGroups or []],
     )
 
-    for model_group in cloud_config.modelGroups:
-        create_model_group_service(ctx, ctx.namespace, model_group)
-
     # Verify that the model group resources are deleted
     apps_v1_api = client.AppsV1Api()
     try:
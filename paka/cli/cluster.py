@@ -30,13 +30,20 @@ def up(
         "This allows kubectl to communicate with the new cluster. "
         "Use this option to prevent updating the kubeconfig file.",
     ),
+    force: bool = typer.Option(
+        False,
+        "--force",
+        help="Re-apply the model group resources even if the configuration has not "
+        "changed since the last successful run. Use this to repair resources that "
+        "were changed outside of paka.",
+    ),
 ) -> None:
     """
     Creates or updates a Kubernetes cluster based on the provided configuration.
     """
     cluster_manager = load_cluster_manager(cluster_config)
     cluster_manager.ctx.set_should_save_kubeconfig(not no_kubeconfig)
-    cluster_manager.create()
+    cluster_manager.create(force=force)
 
 
 @cluster_app.command()
@@ -12,6 +12,7 @@ from kubernetes.client.exceptions import ApiException
 from tabulate import tabulate
 
 from paka.cli.utils import (
+    ensure_cluster_name,
     format_timedelta,
     get_cluster_namespace,
     load_kubeconfig,
@@ -170,6 +171,7 @@ def deploy(
     """
     Deploy a function to a Knative service.
     """
+    cluster_name = ensure_cluster_name(cluster_name)
     load_kubeconfig(cluster_name)
     resolved_image = resolve_image(cluster_name, image, source_dir)
 
@@ -211,6 +213,7 @@ def list(
     """
     List all deployed functions.
     """
+    cluster_name = ensure_cluster_name(cluster_name)
     load_kubeconfig(cluster_name)
     services = list_knative_services(get_cluster_namespace(cluster_name))
 
@@ -260,6 +263,7 @@ def list_revisions(
     """
     List all deployed functions.
     """
+    cluster_name = ensure_cluster_name(cluster_name)
     load_kubeconfig(cluster_name)
     revisions = list_knative_revisions(get_cluster_namespace(cluster_name), name)
 
@@ -389,6 +393,7 @@ def update_traffic(
             logger.error("Traffic distribution aborted by user.")
             raise typer.Abort()
 
+    cluster_name = ensure_cluster_name(cluster_name)
     load_kubeconfig(cluster_name)
     logger.info(f"Updating traffic for function {name}")
     split_traffic_among_revisions(
@@ -426,6 +431,7 @@ def delete(
     if yes or typer.confirm(
         f"Are you sure you want to delete the function {name}?", default=False
     ):
+        cluster_name = ensure_cluster_name(cluster_name)
         load_kubeconfig(cluster_name)
         logger.info(f"Deleting function {name}")
         try:
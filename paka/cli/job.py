@@ -8,6 +8,7 @@ import typer
 from kubernetes import client
 
 from paka.cli.utils import (
+    ensure_cluster_name,
     get_cluster_namespace,
     load_kubeconfig,
     process_envs,
@@ -28,6 +29,36 @@ def prefixed_job_name(job_name: str) -> str:
     return job_name
 
 
+def validate_worker_scaling(
+    worker_throughput: Optional[float], worker_cold_start: Optional[float]
+) -> None:
+    """
+    Validates the worker throughput and cold start options.
+
+    Args:
+        worker_throughput (Optional[float]): The tasks a worker processes per second.
+        worker_cold_start (Optional[float]): The seconds a new worker takes to start.
+
+    Raises:
+        typer.BadParameter: If only one of the options is given, or if either is not
+            positive.
+    """
+    if worker_throughput is None and worker_cold_start is None:
+        return
+    if worker_throughput is None or worker_cold_start is None:
+        raise typer.BadParameter(
+            "--worker-throughput and --worker-cold-start must be given together."
+        )
+    if worker_throughput <= 0:
+        raise typer.BadParameter(
+            "must be greater than 0.", param_hint="--worker-throughput"
+        )
+    if worker_cold_start <= 0:
+        raise typer.BadParameter(
+            "must be greater than 0.", param_hint="--worker-cold-start"
+        )
+
+
 @job_app.command()
 def deploy(
     cluster_name: Optional[str] = typer.Option(
@@ -79,6 +110,33 @@ def deploy(
         help="The number of tasks that need to be allocated to each worker before "
         "the autoscaler creates a new worker.",
     ),
+    worker_throughput: Optional[float] = typer.Option(
+        None,
+        "--worker-throughput",
+        help="The number of tasks a worker processes per second. Together with "
+        "--worker-cold-start, this replaces --tasks-per-worker with the number of "
+        "tasks a worker gets through while a new worker is starting.",
+    ),
+    worker_cold_start: Optional[float] = typer.Option(
+        None,
+        "--worker-cold-start",
+        help="The number of seconds it takes a new worker to start processing "
+        "tasks. Used together with --worker-throughput.",
+    ),
+    polling_interval: int = typer.Option(
+        10,
+        "--polling-interval",
+        min=1,
+        help="How often, in seconds, the autoscaler checks the number of queued "
+        "tasks. A longer interval means fewer queue queries but slower reactions.",
+    ),
+    cooldown_period: int = typer.Option(
+        300,
+        "--cooldown-period",
+        min=0,
+        help="The number of seconds the task queue has to stay empty before all "
+        "workers of the job are removed.",
+    ),
     wait_existing_tasks: bool = typer.Option(
         True,
         "--wait-existing-tasks",
@@ -106,6 +164,8 @@ def deploy(
     """
     Deploy a job.
     """
+    validate_worker_scaling(worker_throughput, worker_cold_start)
+    cluster_name = ensure_cluster_name(cluster_name)
     load_kubeconfig(cluster_name)
     resolved_image = resolve_image(cluster_name, image, source_dir)
 
@@ -131,6 +191,10 @@ def deploy(
         envs=envs,
         resource_requests=resource_requests_dict,
         resource_limits=resource_limits_dict,
+        per_worker_throughput=worker_throughput,
+        cold_start_seconds=worker_cold_start,
+        polling_interval_seconds=polling_interval,
+        cooldown_seconds=cooldown_period,
     )
 
 
@@ -167,6 +231,7 @@ def delete(
     if yes or typer.confirm(
         f"Are you sure you want to delete the job {name}?", default=False
     ):
+        cluster_name = ensure_cluster_name(cluster_name)
         load_kubeconfig(cluster_name)
         logger.info(f"Deleting job {name}")
         delete_workers(
@@ -189,6 +254,7 @@ def list(
     """
     Lists all jobs.
     """
+    cluster_name = ensure_cluster_name(cluster_name)
     load_kubeconfig(cluster_name)
     api_instance = client.AppsV1Api()
 
@@ -32,8 +32,8 @@ def list_downloaded_models(
     """
     List all models that have been downloaded to the object store.
     """
-    load_kubeconfig(cluster_name)
     cluster_name = ensure_cluster_name(cluster_name)
+    load_kubeconfig(cluster_name)
     bucket = read_pulumi_stack(cluster_name, "bucket")
 
     s3 = boto3.client("s3")
@@ -66,6 +66,7 @@ def list(
     """
     List all model groups.
     """
+    cluster_name = ensure_cluster_name(cluster_name)
     load_kubeconfig(cluster_name)
     services = filter_services(get_cluster_namespace(cluster_name))
 
@@ -5,7 +5,12 @@ from typing import Optional
 import typer
 from kubernetes import client
 
-from paka.cli.utils import get_cluster_namespace, load_kubeconfig, resolve_image
+from paka.cli.utils import (
+    ensure_cluster_name,
+    get_cluster_namespace,
+    load_kubeconfig,
+    resolve_image,
+)
 from paka.k8s.utils import tail_logs
 from paka.logger import logger
 from paka.utils import kubify_name, random_str
@@ -53,6 +58,7 @@ def one_off_script(
     in a container with the specified Docker image. If a source directory is provided, a new
     Docker image is built using the source code from that directory.
     """
+    cluster_name = ensure_cluster_name(cluster_name)
     load_kubeconfig(cluster_name)
     resolved_image = resolve_image(cluster_name, image, source_dir)
 
@@ -7,13 +7,11 @@ import re
 import subprocess
 from datetime import timedelta
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
 import typer
 from kubernetes import config as k8s_config
 
-from paka.cluster.manager.aws import AWSClusterManager
-from paka.cluster.manager.base import ClusterManager
 from paka.config import CloudConfig, Config, parse_yaml
 from paka.constants import BP_BUILDER_ENV_VAR
 from paka.container.ecr import push_to_ecr
@@ -21,6 +19,9 @@ from paka.container.pack import ensure_pack
 from paka.logger import logger
 from paka.utils import get_pulumi_root, read_pulumi_stack
 
+if TYPE_CHECKING:
+    from paka.cluster.manager.base import ClusterManager
+
 
 def build_and_push(
     cluster_name: Optional[str],
@@ -156,6 +157,10 @@ def load_cluster_manager(cluster_config: str) -> ClusterManager:
         raise FileNotFoundError(f"The cluster config file does not exist")
 
     if config_data.aws:
+        # Deferred, the cluster manager pulls in the Pulumi providers, which most
+        # commands don't need
+        from paka.cluster.manager.aws import AWSClusterManager
+
         return AWSClusterManager(config=config_data)
     else:
         raise ValueError("Unsupported cloud provider")
@@ -254,10 +259,11 @@ def init_pulumi() -> None:
     the Pulumi state root directory.
 
     This function sets the Pulumi configuration passphrase and backend URL
-    environment variables. If these variables are not already set in the
-    environment, it assigns them default values. The default value for the
-    passphrase is an empty string, and the default for the backend URL is a
-    file URL pointing to the Pulumi root directory.
+    environment variables, and turns off the Pulumi CLI update check. If these
+    variables are not already set in the environment, it assigns them default
+    values. The default value for the passphrase is an empty string, and the
+    default for the backend URL is a file URL pointing to the Pulumi root
+    directory.
 
     The Pulumi root directory is created if it does not already exist.
     """
@@ -271,6 +277,10 @@ def init_pulumi() -> None:
         "PULUMI_DEBUG_COMMANDS", "false"
     )
     os.environ["PULUMI_HOME"] = os.environ.get("PULUMI_HOME", pulumi_root)
+    # The Pulumi CLI version is pinned by paka, checking for updates is wasted time
+    os.environ["PULUMI_SKIP_UPDATE_CHECK"] = os.environ.get(
+        "PULUMI_SKIP_UPDATE_CHECK", "true"
+    )
 
     system = platform.system().lower()
     if system == "windows":
@@ -3,10 +3,12 @@ import pulumi_aws as aws
 from paka.cluster.context import Context
 from paka.cluster.fluentbit import create_fluentbit
 from paka.constants import PROJECT_NAME
+from paka.utils import call_once
 
 LOG_GROUP = f"EKSContainerLogs/{PROJECT_NAME}"
 
 
+@call_once
 def enable_cloudwatch(ctx: Context) -> None:
     aws.cloudwatch.LogGroup(
         "log-group",
@@ -1,12 +1,30 @@
+from typing import Any, Dict
+
 import pulumi
 import pulumi_aws as aws
 import pulumi_eks as eks
 import pulumi_kubernetes.helm.v3 as helm
 from pulumi_kubernetes.core.v1 import ConfigMap
 
-from paka.cluster.aws.utils import odic_role_for_sa
+from paka.cluster.aws.utils import get_policy_document_json, odic_role_for_sa
 from paka.cluster.context import Context
-from paka.utils import call_once, to_yaml
+from paka.utils import call_once, download_cached_chart, to_yaml
+
+CLUSTER_AUTOSCALER_CHART_REPO = "https://kubernetes.github.io/autoscaler"
+CLUSTER_AUTOSCALER_CHART_VERSION = "9.34.0"
+
+# Chart values that don't depend on the cluster being deployed
+_CA_BASE_VALUES: Dict[str, Any] = {
+    "rbac": {
+        "create": True,
+        "serviceAccount": {"create": True, "name": "cluster-autoscaler"},
+    },
+    "serviceMonitor": {"interval": "30s"},
+    "image": {"tag": "v1.28.2"},
+    "extraArgs": {
+        "expander": "priority,random",  # Use priority expander if possible
+    },
+}
 
 
 def create_priority_expander(ctx: Context) -> ConfigMap:
@@ -43,28 +61,20 @@ def create_cluster_autoscaler(
     """
     cluster_name = ctx.cluster_name
 
-    autoscaler_policy_doc = aws.iam.get_policy_document(
-        statements=[
-            aws.iam.GetPolicyDocumentStatementArgs(
-                actions=[
-                    "autoscaling:DescribeAutoScalingGroups",
-                    "autoscaling:DescribeAutoScalingInstances",
-                    "autoscaling:DescribeLaunchConfigurations",
-                    "autoscaling:DescribeTags",
-                    "autoscaling:SetDesiredCapacity",
-                    "autoscaling:TerminateInstanceInAutoScalingGroup",
-                    "ec2:DescribeLaunchTemplateVersions",
-                    "eks:DescribeNodegroup",
-                    "ec2:GetInstanceTypesFromInstanceRequirements",
-                    "ec2:DescribeImages",
-                ],
-                resources=["*"],
-            )
-        ]
-    )
-
-    autoscaler_policy = aws.iam.Policy(
-        f"{cluster_name}-autoscaler-policy", policy=autoscaler_policy_doc.json
+    autoscaler_policy_json = get_policy_document_json(
+        (
+            "autoscaling:DescribeAutoScalingGroups",
+            "autoscaling:DescribeAutoScalingInstances",
+            "autoscaling:DescribeLaunchConfigurations",
+            "autoscaling:DescribeTags",
+            "autoscaling:SetDesiredCapacity",
+            "autoscaling:TerminateInstanceInAutoScalingGroup",
+            "ec2:DescribeLaunchTemplateVersions",
+            "eks:DescribeNodegroup",
+            "ec2:GetInstanceTypesFromInstanceRequirements",
+            "ec2:DescribeImages",
+        ),
+        ("*",),
     )
 
     # The OIDC provider is required because the cluster autoscaler runs within the Kubernetes
@@ -74,40 +84,42 @@ def create_cluster_autoscaler(
         ctx, cluster, "autoscaler", "kube-system:cluster-autoscaler"
     )
 
-    aws.iam.RolePolicyAttachment(
-        f"{cluster_name}-autoscaler-role-policy-attachment",
-        policy_arn=autoscaler_policy.arn,
-        role=autoscaler_role.name,
+    autoscaler_role_policy = aws.iam.RolePolicy(
+        f"{cluster_name}-autoscaler-role-policy",
+        role=autoscaler_role.id,
+        policy=autoscaler_policy_json,
     )
 
     expander = create_priority_expander(ctx)
 
     helm.Chart(
         "cluster-autoscaler",
-        helm.ChartOpts(
-            chart="cluster-autoscaler",
-            version="9.34.0",
+        helm.LocalChartOpts(
+            # The chart is pinned, so it is fetched once and rendered from the local cache
+            path=download_cached_chart(
+                CLUSTER_AUTOSCALER_CHART_REPO,
+                "cluster-autoscaler",
+                CLUSTER_AUTOSCALER_CHART_VERSION,
+            ),
             namespace="kube-system",
-            fetch_opts=helm.FetchOpts(repo="https://kubernetes.github.io/autoscaler"),
             values={
+                **_CA_BASE_VALUES,
                 "autoDiscovery": {"clusterName": cluster.eks_cluster.name},
                 "awsRegion": ctx.region,
                 "rbac": {
-                    "create": True,
+                    **_CA_BASE_VALUES["rbac"],
                     "serviceAccount": {
-                        "create": True,
-                        "name": "cluster-autoscaler",
+                        **_CA_BASE_VALUES["rbac"]["serviceAccount"],
                         "annotations": {
                             "eks.amazonaws.com/role-arn": autoscaler_role.arn
                         },
                     },
                 },
-                "serviceMonitor": {"interval": "2s"},
-                "image": {"tag": "v1.28.2"},
-                "extraArgs": {
-                    "expander": "priority,random",  # Use priority expander if possible
-                },
             },
         ),
-        opts=pulumi.ResourceOptions(provider=ctx.k8s_provider, depends_on=[expander]),
+        # The chart only references the role. Wait for its permissions as well so that
+        # the autoscaler doesn't start without access to the Auto Scaling Groups.
+        opts=pulumi.ResourceOptions(
+            provider=ctx.k8s_provider, depends_on=[expander, autoscaler_role_policy]
+        ),
     )
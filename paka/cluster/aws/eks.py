@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import json
-from typing import List, Optional, cast
+from typing import List, Literal, Optional, Sequence, Union, cast
 
 import pulumi
 import pulumi_aws as aws
@@ -26,7 +26,35 @@ from paka.cluster.redis import create_redis
 from paka.cluster.zipkin import create_zipkin
 from paka.config import AwsMixedModelGroup, AwsModelGroup, NodeGroup
 from paka.k8s.utils import update_kubeconfig
-from paka.utils import kubify_name
+from paka.utils import call_once, download_cached_url, kubify_name
+
+# Pin the metrics server so that the manifest can be cached locally
+METRICS_SERVER_VERSION = "v0.7.1"
+
+# The worker nodes' trust policy never changes, no need to invoke the provider for it.
+WORKER_ASSUME_ROLE_POLICY = json.dumps(
+    {
+        "Version": "2012-10-17",
+        "Statement": [
+            {
+                "Effect": "Allow",
+                "Principal": {"Service": "ec2.amazonaws.com"},
+                "Action": "sts:AssumeRole",
+            }
+        ],
+    }
+)
+
+# AWS managed policies the worker nodes need to join the cluster and pull images
+WORKER_MANAGED_POLICY_ARNS = (
+    "arn:aws:iam::aws:policy/AmazonEKSWorkerNodePolicy",
+    "arn:aws:iam::aws:policy/AmazonEKS_CNI_Policy",
+    "arn:aws:iam::aws:policy/AmazonEC2ContainerRegistryReadOnly",
+)
+
+# Resources whose tags are partly managed by EKS
+_IGNORE_TAGS_TYPES = frozenset({"aws:ec2/vpc:Vpc", "aws:ec2/subnet:Subnet"})
+_IGNORE_TAGS_OPTS = pulumi.ResourceOptions(ignore_changes=["tags"])
 
 
 def _ignore_tags_transformation(
@@ -41,16 +69,93 @@ def _ignore_tags_transformation(
     Returns:
         pulumi.ResourceTransformationResult | None: The transformed resource properties and options, or None if no transformation is needed.
     """
-    if args.type_ == "aws:ec2/vpc:Vpc" or args.type_ == "aws:ec2/subnet:Subnet":
+    if args.type_ in _IGNORE_TAGS_TYPES:
         return pulumi.ResourceTransformationResult(
             props=args.props,
-            opts=pulumi.ResourceOptions.merge(
-                args.opts, pulumi.ResourceOptions(ignore_changes=["tags"])
-            ),
+            opts=pulumi.ResourceOptions.merge(args.opts, _IGNORE_TAGS_OPTS),
         )
     return None
 
 
+def _node_group_opts(cluster: eks.Cluster) -> pulumi.ResourceOptions:
+    """
+    Returns the resource options that nest a node group under its cluster.
+
+    The node groups used to be created at the root of the stack. The alias keeps their
+    previous URNs so that existing node groups are not replaced.
+
+    Args:
+        cluster (eks.Cluster): The EKS cluster the node group belongs to.
+
+    Returns:
+        pulumi.ResourceOptions: The resource options for the node group.
+    """
+    return pulumi.ResourceOptions(
+        parent=cluster, aliases=[pulumi.Alias(parent=pulumi.ROOT_STACK_RESOURCE)]
+    )
+
+
+def _create_model_group_node_group(
+    ctx: Context,
+    cluster: eks.Cluster,
+    model_group: Union[AwsModelGroup, AwsMixedModelGroup],
+    node_role_arn: pulumi.Input[str],
+    subnet_ids: pulumi.Input[Sequence[pulumi.Input[str]]],
+    scaling_config: aws.eks.NodeGroupScalingConfigArgs,
+    lifecycle: Literal["on-demand", "spot"],
+) -> eks.ManagedNodeGroup:
+    """
+    Creates a managed node group that only runs the pods of the given model group.
+
+    Args:
+        ctx (Context): The cluster context.
+        cluster (eks.Cluster): The EKS cluster to create the node group in.
+        model_group (Union[AwsModelGroup, AwsMixedModelGroup]): The model group the nodes are dedicated to.
+        node_role_arn (pulumi.Input[str]): The ARN of the IAM role for the worker nodes.
+        subnet_ids (pulumi.Input[Sequence[pulumi.Input[str]]]): The subnets to launch the nodes in.
+        scaling_config (aws.eks.NodeGroupScalingConfigArgs): The scaling configuration of the node group.
+        lifecycle (Literal["on-demand", "spot"]): Whether the node group uses on-demand or spot instances.
+
+    Returns:
+        eks.ManagedNodeGroup: The created node group.
+    """
+    taints = [
+        aws.eks.NodeGroupTaintArgs(
+            effect="NO_SCHEDULE", key="app", value="model-group"
+        ),
+        aws.eks.NodeGroupTaintArgs(
+            effect="NO_SCHEDULE", key="model", value=model_group.name
+        ),
+    ]
+
+    disk_size = model_group.gpu.diskSize if model_group.gpu else model_group.diskSize
+
+    name_prefix = f"{ctx.cluster_name}-{kubify_name(model_group.name)}"
+    is_spot = lifecycle == "spot"
+
+    return eks.ManagedNodeGroup(
+        f"{name_prefix}-spot-group" if is_spot else f"{name_prefix}-group",
+        node_group_name=f"{name_prefix}-{lifecycle}",
+        cluster=cluster,
+        instance_types=[model_group.nodeType],
+        scaling_config=scaling_config,
+        labels={
+            "size": model_group.nodeType,
+            "app": "model-group",
+            "model": model_group.name,
+            "lifecycle": lifecycle,
+        },
+        node_role_arn=node_role_arn,
+        subnet_ids=subnet_ids,
+        taints=taints,
+        # Supported AMI types https://docs.aws.amazon.com/eks/latest/APIReference/API_Nodegroup.html#AmazonEKS-Type-Nodegroup-amiType
+        ami_type=get_ami_for_instance(ctx, model_group.nodeType),
+        disk_size=disk_size,
+        capacity_type="SPOT" if is_spot else "ON_DEMAND",
+        opts=_node_group_opts(cluster),
+    )
+
+
 def create_node_group_for_model_group(
     ctx: Context,
     cluster: eks.Cluster,
@@ -77,50 +182,25 @@ def create_node_group_for_model_group(
     if ctx.cloud_config.modelGroups is None:
         return
 
-    cluster_name = ctx.cluster_name
-
     model_groups = cast(List[AwsModelGroup], ctx.cloud_config.modelGroups)
 
-    for model_group in model_groups:
-        taints = [
-            aws.eks.NodeGroupTaintArgs(
-                effect="NO_SCHEDULE", key="app", value="model-group"
-            ),
-            aws.eks.NodeGroupTaintArgs(
-                effect="NO_SCHEDULE", key="model", value=model_group.name
-            ),
-        ]
+    # Every node group shares the worker role and the private subnets
+    node_role_arn = worker_role.arn
+    subnet_ids = vpc.private_subnet_ids
 
-        ami_type = get_ami_for_instance(ctx, model_group.nodeType)
-
-        disk_size = (
-            model_group.gpu.diskSize if model_group.gpu else model_group.diskSize
-        )
-
-        # Create a managed node group for our cluster
-        eks.ManagedNodeGroup(
-            f"{cluster_name}-{kubify_name(model_group.name)}-group",
-            node_group_name=f"{cluster_name}-{kubify_name(model_group.name)}-on-demand",
-            cluster=cluster,
-            instance_types=[model_group.nodeType],
-            scaling_config=aws.eks.NodeGroupScalingConfigArgs(
+    for model_group in model_groups:
+        _create_model_group_node_group(
+            ctx,
+            cluster,
+            model_group,
+            node_role_arn,
+            subnet_ids,
+            aws.eks.NodeGroupScalingConfigArgs(
                 desired_size=model_group.minInstances,
                 min_size=model_group.minInstances,
                 max_size=model_group.maxInstances,
             ),
-            labels={
-                "size": model_group.nodeType,
-                "app": "model-group",
-                "model": model_group.name,
-                "lifecycle": "on-demand",
-            },
-            node_role_arn=worker_role.arn,
-            subnet_ids=vpc.private_subnet_ids,
-            taints=taints,
-            # Supported AMI types https://docs.aws.amazon.com/eks/latest/APIReference/API_Nodegroup.html#AmazonEKS-Type-Nodegroup-amiType
-            ami_type=ami_type,
-            disk_size=disk_size,
-            capacity_type="ON_DEMAND",
+            "on-demand",
         )
 
 
@@ -134,80 +214,41 @@ def create_node_group_for_mixed_model_group(
     if ctx.cloud_config.mixedModelGroups is None:
         return
 
-    cluster_name = ctx.cluster_name
-
     mixed_model_groups = cast(
         List[AwsMixedModelGroup], ctx.cloud_config.mixedModelGroups
     )
 
-    for mixed_model_group in mixed_model_groups:
-        taints = [
-            aws.eks.NodeGroupTaintArgs(
-                effect="NO_SCHEDULE", key="app", value="model-group"
-            ),
-            aws.eks.NodeGroupTaintArgs(
-                effect="NO_SCHEDULE", key="model", value=mixed_model_group.name
-            ),
-        ]
-
-        ami_type = get_ami_for_instance(ctx, mixed_model_group.nodeType)
+    node_role_arn = worker_role.arn
+    subnet_ids = vpc.private_subnet_ids
 
-        disk_size = (
-            mixed_model_group.gpu.diskSize
-            if mixed_model_group.gpu
-            else mixed_model_group.diskSize
-        )
-
-        # Create a managed node group for our cluster
-        eks.ManagedNodeGroup(
-            f"{cluster_name}-{kubify_name(mixed_model_group.name)}-group",
-            node_group_name=f"{cluster_name}-{kubify_name(mixed_model_group.name)}-on-demand",
-            cluster=cluster,
-            instance_types=[mixed_model_group.nodeType],
-            scaling_config=aws.eks.NodeGroupScalingConfigArgs(
+    for mixed_model_group in mixed_model_groups:
+        _create_model_group_node_group(
+            ctx,
+            cluster,
+            mixed_model_group,
+            node_role_arn,
+            subnet_ids,
+            aws.eks.NodeGroupScalingConfigArgs(
                 desired_size=mixed_model_group.baseInstances,
                 min_size=mixed_model_group.baseInstances,
                 max_size=mixed_model_group.maxOnDemandInstances,
             ),
-            labels={
-                "size": mixed_model_group.nodeType,
-                "app": "model-group",
-                "model": mixed_model_group.name,
-                "lifecycle": "on-demand",
-            },
-            node_role_arn=worker_role.arn,
-            subnet_ids=vpc.private_subnet_ids,
-            taints=taints,
-            # Supported AMI types https://docs.aws.amazon.com/eks/latest/APIReference/API_Nodegroup.html#AmazonEKS-Type-Nodegroup-amiType
-            ami_type=ami_type,
-            disk_size=disk_size,
-            capacity_type="ON_DEMAND",
+            "on-demand",
         )
 
         # Create a managed node group with spot instances
-        eks.ManagedNodeGroup(
-            f"{cluster_name}-{kubify_name(mixed_model_group.name)}-spot-group",
-            node_group_name=f"{cluster_name}-{kubify_name(mixed_model_group.name)}-spot",
-            cluster=cluster,
-            instance_types=[mixed_model_group.nodeType],
-            scaling_config=aws.eks.NodeGroupScalingConfigArgs(
+        _create_model_group_node_group(
+            ctx,
+            cluster,
+            mixed_model_group,
+            node_role_arn,
+            subnet_ids,
+            aws.eks.NodeGroupScalingConfigArgs(
                 desired_size=mixed_model_group.spot.minInstances,
                 min_size=mixed_model_group.spot.minInstances,
                 max_size=mixed_model_group.spot.maxInstances,
             ),
-            labels={
-                "size": mixed_model_group.nodeType,
-                "app": "model-group",
-                "model": mixed_model_group.name,
-                "lifecycle": "spot",
-            },
-            node_role_arn=worker_role.arn,
-            subnet_ids=vpc.private_subnet_ids,
-            taints=taints,
-            # Supported AMI types https://docs.aws.amazon.com/eks/latest/APIReference/API_Nodegroup.html#AmazonEKS-Type-Nodegroup-amiType
-            ami_type=ami_type,
-            disk_size=disk_size,
-            capacity_type="SPOT",
+            "spot",
         )
 
 
@@ -269,6 +310,7 @@ def create_node_group_for_qdrant(
             aws.eks.NodeGroupTaintArgs(effect="NO_SCHEDULE", key="app", value="qdrant"),
         ],
         disk_size=vectorStore.diskSize,
+        opts=_node_group_opts(cluster),
     )
 
 
@@ -283,15 +325,18 @@ def _create_node_groups(
     if node_groups is None:
         return
 
-    cluster_name = ctx.cluster_name
+    name_prefix = f"{ctx.cluster_name}-{app}-group"
+    node_role_arn = worker_role.arn
+    subnet_ids = vpc.private_subnet_ids
+
     for i, node_group in enumerate(node_groups):
         ami_type = get_ami_for_instance(ctx, node_group.nodeTypes[0])
 
         lifecycle = node_group.isSpot and "spot" or "on-demand"
         # Create a managed node group for our cluster
         eks.ManagedNodeGroup(
-            f"{cluster_name}-{app}-group-{i}",
-            node_group_name=f"{cluster_name}-{app}-group-{i}-{lifecycle}",
+            f"{name_prefix}-{i}",
+            node_group_name=f"{name_prefix}-{i}-{lifecycle}",
             cluster=cluster,
             instance_types=node_group.nodeTypes,
             scaling_config=aws.eks.NodeGroupScalingConfigArgs(
@@ -303,14 +348,15 @@ def _create_node_groups(
                 "app": app,
                 "lifecycle": lifecycle,
             },
-            node_role_arn=worker_role.arn,
-            subnet_ids=vpc.private_subnet_ids,
+            node_role_arn=node_role_arn,
+            subnet_ids=subnet_ids,
             taints=[
                 aws.eks.NodeGroupTaintArgs(effect="NO_SCHEDULE", key="app", value=app),
             ],
             disk_size=node_group.diskSize,
             capacity_type="SPOT" if node_group.isSpot else "ON_DEMAND",
             ami_type=ami_type,
+            opts=_node_group_opts(cluster),
         )
 
 
@@ -348,6 +394,7 @@ def create_node_groups_for_job(
     )
 
 
+@call_once
 def create_k8s_cluster(ctx: Context) -> eks.Cluster:
     """
     Provisions an AWS EKS cluster with the necessary resources.
@@ -367,30 +414,10 @@ def create_k8s_cluster(ctx: Context) -> eks.Cluster:
     """
     cluster_name = ctx.cluster_name
 
-    managed_policy_arns = [
-        "arn:aws:iam::aws:policy/AmazonEKSWorkerNodePolicy",
-        "arn:aws:iam::aws:policy/AmazonEKS_CNI_Policy",
-        "arn:aws:iam::aws:policy/AmazonEC2ContainerRegistryReadOnly",
-    ]
-    assume_role_policy = aws.iam.get_policy_document(
-        statements=[
-            aws.iam.GetPolicyDocumentStatementArgs(
-                actions=["sts:AssumeRole"],
-                effect="Allow",
-                principals=[
-                    aws.iam.GetPolicyDocumentStatementPrincipalArgs(
-                        type="Service",
-                        identifiers=["ec2.amazonaws.com"],
-                    ),
-                ],
-            ),
-        ],
-    ).json
-
     worker_role = aws.iam.Role(
         f"{cluster_name}-eks-worker-role",
-        assume_role_policy=assume_role_policy,
-        managed_policy_arns=managed_policy_arns,
+        assume_role_policy=WORKER_ASSUME_ROLE_POLICY,
+        managed_policy_arns=list(WORKER_MANAGED_POLICY_ARNS),
     )
 
     # Create a VPC for our cluster
@@ -443,6 +470,7 @@ def create_k8s_cluster(ctx: Context) -> eks.Cluster:
         labels={"size": ctx.cloud_config.cluster.nodeType, "group": "default"},
         node_role_arn=worker_role.arn,
         subnet_ids=vpc.private_subnet_ids,
+        opts=_node_group_opts(cluster),
     )
 
     # Create a managed node group for each model group
@@ -468,7 +496,9 @@ def create_k8s_cluster(ctx: Context) -> eks.Cluster:
         # HPA requires metrics to be available in order to scale the pods.
         k8s.yaml.ConfigFile(
             "metrics-server",
-            file="https://github.com/kubernetes-sigs/metrics-server/releases/latest/download/components.yaml",
+            file=download_cached_url(
+                f"https://github.com/kubernetes-sigs/metrics-server/releases/download/{METRICS_SERVER_VERSION}/components.yaml"
+            ),
             opts=pulumi.ResourceOptions(provider=k8s_provider),
         )
 
@@ -1,10 +1,10 @@
 from __future__ import annotations
 
-import json
 from typing import Optional
 
 import boto3
-from kubernetes import client, config
+
+from paka.k8s.utils import get_core_v1_api
 
 
 # Pulumi cannot update the idle timeout of an ELB. This script uses boto3 to
@@ -34,9 +34,7 @@ def update_elb_idle_timeout(kubeconfig_json: str, idle_timeout_seconds: int) ->
 
 
 def get_elb_name(kubeconfig_json: str) -> Optional[str]:
-    config.load_kube_config_from_dict(json.loads(kubeconfig_json))
-
-    v1 = client.CoreV1Api()
+    v1 = get_core_v1_api(kubeconfig_json)
     services = v1.list_service_for_all_namespaces(watch=False)
 
     for service in services.items:
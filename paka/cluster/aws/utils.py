@@ -1,6 +1,8 @@
 from __future__ import annotations
 
-from typing import Sequence
+import json
+from functools import lru_cache
+from typing import Sequence, Tuple
 
 import pulumi
 import pulumi_aws as aws
@@ -10,6 +12,26 @@ from pulumi import Input
 from paka.cluster.context import Context
 from paka.utils import get_instance_info
 
+# The trust policy of a service account role only differs by the OIDC provider
+# and the service account. Serialize it once and fill in the placeholders.
+_OIDC_TRUST_POLICY_TEMPLATE = json.dumps(
+    {
+        "Version": "2012-10-17",
+        "Statement": [
+            {
+                "Effect": "Allow",
+                "Principal": {"Federated": "__ARN__"},
+                "Action": "sts:AssumeRoleWithWebIdentity",
+                "Condition": {
+                    "StringEquals": {
+                        "__URL__:sub": "system:serviceaccount:__SERVICE_ACCOUNT__"
+                    }
+                },
+            }
+        ],
+    }
+)
+
 
 def odic_role_for_sa(
     ctx: Context,
@@ -32,29 +54,14 @@ def odic_role_for_sa(
     oidc_url = cluster.core.oidc_provider.url
     oidc_arn = cluster.core.oidc_provider.arn
 
-    assume_role_policy = pulumi.Output.all(oidc_url, oidc_arn).apply(
-        lambda args: aws.iam.get_policy_document(
-            statements=[
-                aws.iam.GetPolicyDocumentStatementArgs(
-                    effect="Allow",
-                    principals=[
-                        aws.iam.GetPolicyDocumentStatementPrincipalArgs(
-                            type="Federated",
-                            identifiers=[str(args[1])],
-                        )
-                    ],
-                    actions=["sts:AssumeRoleWithWebIdentity"],
-                    conditions=[
-                        aws.iam.GetPolicyDocumentStatementConditionArgs(
-                            test="StringEquals",
-                            variable=f"{args[0]}:sub",
-                            values=[f"system:serviceaccount:{ns_service_account}"],
-                        )
-                    ],
-                )
-            ],
-        ).json
+    trust_policy = _OIDC_TRUST_POLICY_TEMPLATE.replace(
+        "__SERVICE_ACCOUNT__", ns_service_account
     )
+    # The provider ARN comes before the URL in the template. Splice the outputs in
+    # with Output.concat rather than resolving them through an apply callback.
+    head, rest = trust_policy.split("__ARN__")
+    middle, tail = rest.split("__URL__")
+    assume_role_policy = pulumi.Output.concat(head, oidc_arn, middle, oidc_url, tail)
 
     role = aws.iam.Role(
         f"{ctx.cluster_name}-{role_name}-role",
@@ -64,6 +71,38 @@ def odic_role_for_sa(
     return role
 
 
+@lru_cache(maxsize=None)
+def get_policy_document_json(
+    actions: Tuple[str, ...], resources: Tuple[str, ...], effect: str = "Allow"
+) -> str:
+    """
+    Renders a single statement IAM policy document.
+
+    The document is a pure function of its statement, so it is serialized locally
+    rather than through the aws.iam.get_policy_document data source, and cached.
+
+    Args:
+        actions (Tuple[str, ...]): The actions allowed or denied by the statement.
+        resources (Tuple[str, ...]): The resources the statement applies to.
+        effect (str, optional): The effect of the statement. Defaults to "Allow".
+
+    Returns:
+        str: The policy document in JSON format.
+    """
+    return json.dumps(
+        {
+            "Version": "2012-10-17",
+            "Statement": [
+                {
+                    "Effect": effect,
+                    "Action": list(actions),
+                    "Resource": list(resources),
+                }
+            ],
+        }
+    )
+
+
 def get_ami_for_instance(ctx: Context, instance_type: str) -> str:
     instance_info = get_instance_info(ctx.provider, ctx.region, instance_type)
     gpu_count = instance_info.get("gpu_count", 0) or 0
@@ -5,6 +5,23 @@ from paka.cluster.context import Context
 from paka.constants import ACCESS_ALL_SA
 from paka.utils import call_once
 
+# Pin the image so that node restarts don't need to resolve `latest` against the registry
+FLUENT_BIT_IMAGE = "fluent/fluent-bit:3.0.4"
+
+# (volume name, mount path, sub path, read only)
+_VOLUME_MOUNTS = [
+    ("config", "/fluent-bit/etc/fluent-bit.conf", "fluent-bit.conf", None),
+    ("varlog", "/var/log", None, None),
+    ("varlibdockercontainers", "/var/lib/docker/containers", None, True),
+    ("parsers-config", "/fluent-bit/etc/parsers.conf", "parsers.conf", None),
+]
+
+# Host directories the log files are read from
+_HOST_PATHS = {
+    "varlog": "/var/log",
+    "varlibdockercontainers": "/var/lib/docker/containers",
+}
+
 
 @call_once
 def create_fluentbit(ctx: Context, fluent_bit_config: str) -> None:
@@ -39,6 +56,35 @@ def create_fluentbit(ctx: Context, fluent_bit_config: str) -> None:
         opts=pulumi.ResourceOptions(provider=ctx.k8s_provider),
     )
 
+    config_maps = {
+        "config": fluent_bit_config_map,
+        "parsers-config": parsers_config_map,
+    }
+
+    volume_mounts = [
+        k8s.core.v1.VolumeMountArgs(
+            name=name, mount_path=mount_path, sub_path=sub_path, read_only=read_only
+        )
+        for name, mount_path, sub_path, read_only in _VOLUME_MOUNTS
+    ]
+
+    volumes = [
+        (
+            k8s.core.v1.VolumeArgs(
+                name=name,
+                config_map=k8s.core.v1.ConfigMapVolumeSourceArgs(
+                    name=config_maps[name].metadata["name"],
+                ),
+            )
+            if name in config_maps
+            else k8s.core.v1.VolumeArgs(
+                name=name,
+                host_path=k8s.core.v1.HostPathVolumeSourceArgs(path=_HOST_PATHS[name]),
+            )
+        )
+        for name, _, _, _ in _VOLUME_MOUNTS
+    ]
+
     k8s.apps.v1.DaemonSet(
         "fluent-bit-daemonset",
         spec=k8s.apps.v1.DaemonSetSpecArgs(
@@ -56,56 +102,12 @@ def create_fluentbit(ctx: Context, fluent_bit_config: str) -> None:
                     containers=[
                         k8s.core.v1.ContainerArgs(
                             name="fluent-bit",
-                            image="fluent/fluent-bit:latest",
-                            volume_mounts=[
-                                k8s.core.v1.VolumeMountArgs(
-                                    name="config",
-                                    mount_path="/fluent-bit/etc/fluent-bit.conf",
-                                    sub_path="fluent-bit.conf",
-                                ),
-                                k8s.core.v1.VolumeMountArgs(
-                                    name="varlog",
-                                    mount_path="/var/log",
-                                ),
-                                k8s.core.v1.VolumeMountArgs(
-                                    name="varlibdockercontainers",
-                                    mount_path="/var/lib/docker/containers",
-                                    read_only=True,
-                                ),
-                                k8s.core.v1.VolumeMountArgs(
-                                    name="parsers-config",
-                                    mount_path="/fluent-bit/etc/parsers.conf",
-                                    sub_path="parsers.conf",
-                                ),
-                            ],
+                            image=FLUENT_BIT_IMAGE,
+                            image_pull_policy="IfNotPresent",
+                            volume_mounts=volume_mounts,
                         )
                     ],
-                    volumes=[
-                        k8s.core.v1.VolumeArgs(
-                            name="config",
-                            config_map=k8s.core.v1.ConfigMapVolumeSourceArgs(
-                                name=fluent_bit_config_map.metadata["name"],
-                            ),
-                        ),
-                        k8s.core.v1.VolumeArgs(
-                            name="varlog",
-                            host_path=k8s.core.v1.HostPathVolumeSourceArgs(
-                                path="/var/log",
-                            ),
-                        ),
-                        k8s.core.v1.VolumeArgs(
-                            name="varlibdockercontainers",
-                            host_path=k8s.core.v1.HostPathVolumeSourceArgs(
-                                path="/var/lib/docker/containers",
-                            ),
-                        ),
-                        k8s.core.v1.VolumeArgs(
-                            name="parsers-config",
-                            config_map=k8s.core.v1.ConfigMapVolumeSourceArgs(
-                                name=parsers_config_map.metadata["name"],
-                            ),
-                        ),
-                    ],
+                    volumes=volumes,
                 ),
             ),
         ),
@@ -4,6 +4,7 @@ from pulumi_kubernetes.helm.v3 import Chart, ChartOpts, FetchOpts
 
 from paka.cluster.context import Context
 from paka.cluster.prometheus import create_prometheus
+from paka.cluster.utils import strip_status
 from paka.utils import call_once
 
 
@@ -32,6 +33,7 @@ def create_keda(ctx: Context) -> None:
             namespace="keda",
             fetch_opts=FetchOpts(repo="https://kedacore.github.io/charts"),
             values={},
+            transformations=[strip_status],
         ),
         opts=pulumi.ResourceOptions(
             provider=ctx.k8s_provider, depends_on=[ns, *dependencies]
@@ -1,20 +1,34 @@
 from __future__ import annotations
 
-from functools import partial
-from typing import Any, Callable, Dict
+import re
+from typing import Any, Dict, Tuple
 
 import pulumi
 import pulumi_kubernetes as k8s
 from pulumi import ResourceOptions
-from pulumi_kubernetes.yaml import ConfigFile
+from pulumi_kubernetes.yaml import ConfigFile, ConfigGroup
+from ruamel.yaml import YAML
 
 from paka.cluster.context import Context
 from paka.cluster.prometheus import create_prometheus
-from paka.utils import call_once
+from paka.cluster.utils import strip_status
+from paka.utils import call_once, download_cached_url
 
 VERSION = "v1.12.3"
 ISTIO_VERSION = "v1.12.1"
 
+_YAML = YAML(typ="safe")
+
+# The manifest is split on the raw text, so that it is only decoded in full once, by
+# the provider
+_DOCUMENT_SEPARATOR_RE = re.compile(r"^---[ \t]*$", re.MULTILINE)
+# A document with anything other than comments and blank lines
+_NON_EMPTY_DOCUMENT_RE = re.compile(r"^[ \t]*[^#\s]", re.MULTILINE)
+# The top-level metadata block of a document
+_METADATA_BLOCK_RE = re.compile(
+    r"^metadata:.*(?:\n(?:[ \t].*|[ \t]*(?=\n)))*", re.MULTILINE
+)
+
 
 def limit_hpa_min_replicas(args: Any, opts: pulumi.ResourceOptions) -> None:
     if (
@@ -50,29 +64,61 @@ def crd_resources(labels: Dict[str, Any]) -> bool:
     return labels.get("knative.dev/crd-install") == "true"
 
 
-def non_crd_resources(labels: Dict[str, Any]) -> bool:
-    return labels.get("knative.dev/crd-install") != "true"
+def is_crd_document(document: str) -> bool:
+    """
+    Checks whether a YAML document carries the CRD install label in its metadata.
+
+    Only the top-level metadata block is decoded, and only for documents that mention
+    the label at all.
+
+    Args:
+        document (str): The YAML document.
+
+    Returns:
+        bool: True if the document is part of the CRD install, False otherwise.
+    """
+    if "knative.dev/crd-install" not in document:
+        return False
+    match = _METADATA_BLOCK_RE.search(document)
+    if not match:
+        return False
+    metadata = (_YAML.load(match.group(0)) or {}).get("metadata") or {}
+    return crd_resources(metadata.get("labels") or {})
 
 
-def crd_install_filter(
-    inputs: Any, opts: ResourceOptions, filter: Callable[[Any], bool]
-) -> None:
-    if "metadata" in inputs:
-        if not filter(inputs["metadata"].get("labels", {})):
-            inputs["kind"] = "List"
-            inputs["items"] = []
+def split_crd_documents(yaml_file: str) -> Tuple[str, str]:
+    """
+    Splits a multi-document YAML file into the CRD install documents and the rest.
+
+    Args:
+        yaml_file (str): The path to the YAML file.
+
+    Returns:
+        Tuple[str, str]: The CRD documents and the other documents, as YAML strings.
+    """
+    with open(yaml_file, "r") as file:
+        documents = _DOCUMENT_SEPARATOR_RE.split(file.read())
+
+    crd_documents, other_documents = [], []
+    for document in documents:
+        if not _NON_EMPTY_DOCUMENT_RE.search(document):
+            continue
+        if is_crd_document(document):
+            crd_documents.append(document)
+        else:
+            other_documents.append(document)
+
+    return "---".join(crd_documents), "---".join(other_documents)
 
 
 def exclude_knative_eventing_namespace(inputs: Any, opts: ResourceOptions) -> None:
-    if "metadata" in inputs and inputs["metadata"]["namespace"] == "knative-eventing":
+    metadata = inputs.get("metadata")
+    # Cluster scoped objects have no namespace
+    if metadata and metadata.get("namespace") == "knative-eventing":
         inputs["kind"] = "List"
         inputs["items"] = []
 
 
-only_crd_transform = partial(crd_install_filter, filter=crd_resources)
-non_crd_transform = partial(crd_install_filter, filter=non_crd_resources)
-
-
 # TODO: Decouple knative and istio
 @call_once
 def create_knative_and_istio(ctx: Context) -> None:
@@ -82,6 +128,7 @@ def create_knative_and_istio(ctx: Context) -> None:
         opts=pulumi.ResourceOptions(provider=ctx.k8s_provider),
     )
 
+    # The release manifests are pinned by version, so they are downloaded only once
     yaml_files = [
         # TODO: sigstore verification
         # Creates resources under the knative-serving namespace
@@ -90,33 +137,51 @@ def create_knative_and_istio(ctx: Context) -> None:
     for i, yaml_file in enumerate(yaml_files):
         ConfigFile(
             yaml_file.split("/")[-1],
-            file=yaml_file,
+            file=download_cached_url(yaml_file),
+            transformations=[strip_status],
             opts=pulumi.ResourceOptions(provider=ctx.k8s_provider, depends_on=[ns]),
         )
 
-    yaml_file = f"https://github.com/knative/net-istio/releases/download/knative-{ISTIO_VERSION}/istio.yaml"
-    istio_crd_install = ConfigFile(
+    yaml_file = download_cached_url(
+        f"https://github.com/knative/net-istio/releases/download/knative-{ISTIO_VERSION}/istio.yaml"
+    )
+    # Register each half of the manifest once, rather than the whole manifest twice
+    # with the unwanted half filtered out. The alias keeps the URNs from when these
+    # were ConfigFiles.
+    crd_yaml, non_crd_yaml = split_crd_documents(yaml_file)
+    config_file_alias = pulumi.Alias(type_="kubernetes:yaml:ConfigFile")
+
+    istio_crd_install = ConfigGroup(
         "istio-crd-install",
-        file=yaml_file,
-        transformations=[only_crd_transform],
-        opts=pulumi.ResourceOptions(provider=ctx.k8s_provider, depends_on=[ns]),
+        yaml=[crd_yaml],
+        transformations=[strip_status],
+        opts=pulumi.ResourceOptions(
+            provider=ctx.k8s_provider, depends_on=[ns], aliases=[config_file_alias]
+        ),
     )
 
-    istio_full_install = ConfigFile(
+    istio_full_install = ConfigGroup(
         "istio-non-crd-install",
-        file=yaml_file,
+        yaml=[non_crd_yaml],
         transformations=[
-            non_crd_transform,
+            strip_status,
             limit_resources,
             limit_hpa_min_replicas,
             limit_deployment_replicas,
         ],
         opts=pulumi.ResourceOptions(
-            provider=ctx.k8s_provider, depends_on=[istio_crd_install, ns]
+            provider=ctx.k8s_provider,
+            depends_on=[istio_crd_install, ns],
+            aliases=[config_file_alias],
         ),
     )
 
-    yaml_file = f"https://github.com/knative/net-istio/releases/download/knative-{ISTIO_VERSION}/net-istio.yaml"
+    yaml_file = download_cached_url(
+        f"https://github.com/knative/net-istio/releases/download/knative-{ISTIO_VERSION}/net-istio.yaml"
+    )
+    # net-istio creates objects in the istio-system namespace (e.g. the
+    # knative-local-gateway Service) and pods that need the sidecar injector, both of
+    # which come from the non-CRD install, so it has to wait for that too.
     net_istio = ConfigFile(
         "net-istio",
         file=yaml_file,
@@ -125,7 +190,9 @@ def create_knative_and_istio(ctx: Context) -> None:
         ),
     )
 
-    yaml_file = f"https://github.com/knative/serving/releases/download/knative-{VERSION}/serving-default-domain.yaml"
+    yaml_file = download_cached_url(
+        f"https://github.com/knative/serving/releases/download/knative-{VERSION}/serving-default-domain.yaml"
+    )
     ConfigFile(
         "kn-default-domain",
         file=yaml_file,
@@ -140,6 +207,7 @@ def create_knative_and_istio(ctx: Context) -> None:
     if not prometheus:
         return
 
+    # Not cached, this manifest tracks the main branch
     yaml_file = "https://raw.githubusercontent.com/knative-extensions/monitoring/main/servicemonitor.yaml"
 
     ConfigFile(
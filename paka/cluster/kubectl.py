@@ -1,6 +1,8 @@
 import os
 import platform
 import shutil
+import time
+from functools import lru_cache
 from pathlib import Path
 
 import requests
@@ -10,22 +12,53 @@ from paka.utils import download_url, get_project_data_dir
 
 KUBECTL_VERSION_URL = "https://cdn.dl.k8s.io/release/stable.txt"
 CHUNK_SIZE = 8192
+# How long a looked up kubectl version is trusted before asking again
+KUBECTL_VERSION_CACHE_TTL = 24 * 60 * 60
 
 
 def get_latest_kubectl_version() -> str:
-    """Return the latest version of kubectl available for download."""
+    """
+    Return the latest version of kubectl available for download.
+
+    The answer is cached on disk for a day. If the lookup fails, a stale cached
+    version is still preferred over the hard-coded fallback.
+    """
+    cache_file = Path(get_project_data_dir()) / "cache" / "kubectl-stable.txt"
+    if (
+        cache_file.exists()
+        and time.time() - cache_file.stat().st_mtime < KUBECTL_VERSION_CACHE_TTL
+    ):
+        return cache_file.read_text().strip()
+
     try:
         response = requests.get(KUBECTL_VERSION_URL)
         response.raise_for_status()
-        return response.text
+        version = response.text.strip()
     except requests.RequestException as e:
+        if cache_file.exists():
+            return cache_file.read_text().strip()
         logger.error(f"Failed to get latest kubectl version: {e}")
         return "v1.30.0"
 
+    cache_file.parent.mkdir(parents=True, exist_ok=True)
+    partial_file = cache_file.with_name(f"{cache_file.name}.partial")
+    partial_file.write_text(version)
+    os.replace(partial_file, cache_file)
+
+    return version
+
 
 # We are not pinning the version of kubectl to a specific version
 # Get the latest version of kubectl should be safe
-KUBECTL_VERSION = os.getenv("KUBECTL_VERSION", get_latest_kubectl_version())
+@lru_cache(maxsize=1)
+def get_kubectl_version() -> str:
+    """
+    Return the kubectl version to use.
+
+    The version is resolved on first use rather than at import time, so that commands
+    which never need kubectl don't pay for the lookup.
+    """
+    return os.getenv("KUBECTL_VERSION") or get_latest_kubectl_version()
 
 
 # install_path is a full path to the kubectl binary
@@ -55,7 +88,7 @@ def ensure_kubectl_by_path(install_path: Path) -> None:
     if not install_path.exists():
         url = os.getenv(
             "KUBECTL_DOWNLOAD_URL",
-            f"https://dl.k8s.io/release/{KUBECTL_VERSION}/bin/{system}/{arch}/kubectl",
+            f"https://dl.k8s.io/release/{get_kubectl_version()}/bin/{system}/{arch}/kubectl",
         )
         if system == "windows" and not url.endswith(".exe"):
             url += ".exe"
@@ -71,7 +104,10 @@ def ensure_kubectl_by_path(install_path: Path) -> None:
 def ensure_kubectl() -> None:
     system = platform.system().lower()
     kubectl_path = (
-        Path(get_project_data_dir()) / "bin" / f"kubectl-{KUBECTL_VERSION}" / "kubectl"
+        Path(get_project_data_dir())
+        / "bin"
+        / f"kubectl-{get_kubectl_version()}"
+        / "kubectl"
     )
     if system == "windows":
         kubectl_path = kubectl_path.with_suffix(".exe")
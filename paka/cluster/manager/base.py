@@ -1,11 +1,19 @@
 from __future__ import annotations
 
+import concurrent.futures
+import hashlib
+import json
+import os
 from abc import ABC, abstractmethod
 from functools import cached_property
-from typing import Any
+from pathlib import Path
+from typing import Any, Dict, List
 
+from kubernetes import client
+from kubernetes import config as k8s_config
 from pulumi import automation as auto
 
+from paka import __version__
 from paka.cluster.context import Context
 from paka.cluster.pulumi import ensure_pulumi
 from paka.config import CloudConfig, Config
@@ -13,14 +21,19 @@ from paka.constants import PULUMI_STACK_NAME
 from paka.k8s.model_group.service import (
     cleanup_staled_model_group_services,
     create_model_group_service,
+    save_model_to_store,
 )
 from paka.k8s.model_group.service_v1 import (
     create_model_group_service as create_model_group_service_v1,
 )
-from paka.logger import logger
+from paka.logger import BufferedOutput, logger
+from paka.utils import get_cluster_data_dir, kubify_name
 
 STACK_NAME = "default"
 
+# Bound the number of model groups set up at once to go easy on the API server
+MAX_CONCURRENT_MODEL_GROUPS = 4
+
 
 class ClusterManager(ABC):
     """
@@ -46,10 +59,17 @@ class ClusterManager(ABC):
         pass
 
     def _stack_for_program(self, program: auto.PulumiFn) -> auto.Stack:
+        env_vars: Dict[str, str] = {}
+        if self.cloud_config.cluster.skipCheckpoints:
+            # Checkpoint skipping is still behind Pulumi's experimental flag
+            env_vars["PULUMI_EXPERIMENTAL"] = "true"
+            env_vars["PULUMI_SKIP_CHECKPOINTS"] = "true"
+
         return auto.create_or_select_stack(
             stack_name=PULUMI_STACK_NAME,
             project_name=self.cloud_config.cluster.name,
             program=program,
+            opts=auto.LocalWorkspaceOptions(env_vars=env_vars),
         )
 
     @cached_property
@@ -61,7 +81,7 @@ class ClusterManager(ABC):
 
         return self._stack_for_program(program)
 
-    def create(self) -> None:
+    def create(self, force: bool = False) -> None:
         if self.config.aws is None:
             raise ValueError("Only AWS is supported.")
 
@@ -71,7 +91,8 @@ class ClusterManager(ABC):
             )
 
         logger.info("Creating resources...")
-        self._stack.up(on_output=logger.info)
+        with BufferedOutput() as on_output:
+            self._stack.up(on_output=on_output)
 
         if (
             self.cloud_config.modelGroups is None
@@ -81,6 +102,11 @@ class ClusterManager(ABC):
 
         namespace = self.cloud_config.cluster.namespace
 
+        # Load the kubeconfig once, up front. Loading replaces the default client
+        # configuration, so it must not happen from the worker threads below.
+        assert self.ctx.kubeconfig
+        k8s_config.load_kube_config_from_dict(json.loads(self.ctx.kubeconfig))
+
         # Clean up staled model group resources before creating new ones
         model_group_names = [mg.name for mg in self.config.aws.modelGroups or []]
         mixed_model_group_names = [
@@ -91,21 +117,110 @@ class ClusterManager(ABC):
         cleanup_staled_model_group_services(namespace, all_group_names)
         # TODO: We should clean up deployment as well
 
-        for model_group in self.cloud_config.modelGroups or []:
-            create_model_group_service(self.ctx, namespace, model_group)
+        # Nothing to apply if neither the config nor the cluster changed since the last
+        # successful run and the model group deployments are still there. Objects
+        # edited out-of-band are only repaired with force.
+        hash_file = Path(
+            get_cluster_data_dir(self.cloud_config.cluster.name), "model_groups.sha256"
+        )
+        spec_hash = self._model_groups_hash()
+        if (
+            not force
+            and hash_file.exists()
+            and hash_file.read_text() == spec_hash
+            and self._model_group_deployments_exist(namespace, all_group_names)
+        ):
+            logger.info("Model groups are up to date.")
+            return
 
-        for mixed_model_group in self.cloud_config.mixedModelGroups or []:
-            create_model_group_service_v1(self.ctx, namespace, mixed_model_group)
+        # Saving a model downloads it and uploads it to the model store with pools of
+        # its own, and shows progress bars, so models are saved one at a time
+        for model_group in [
+            *(self.cloud_config.modelGroups or []),
+            *(self.cloud_config.mixedModelGroups or []),
+        ]:
+            save_model_to_store(self.ctx, model_group)
+
+        # The Kubernetes resources of model groups don't depend on each other, so
+        # apply them concurrently
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=MAX_CONCURRENT_MODEL_GROUPS
+        ) as executor:
+            futures = [
+                executor.submit(
+                    create_model_group_service, self.ctx, namespace, model_group
+                )
+                for model_group in self.cloud_config.modelGroups or []
+            ] + [
+                executor.submit(
+                    create_model_group_service_v1,
+                    self.ctx,
+                    namespace,
+                    mixed_model_group,
+                )
+                for mixed_model_group in self.cloud_config.mixedModelGroups or []
+            ]
+            for future in concurrent.futures.as_completed(futures):
+                # Surface the first failure
+                future.result()
+
+        hash_file.parent.mkdir(parents=True, exist_ok=True)
+        partial_file = hash_file.with_name(f"{hash_file.name}.partial")
+        partial_file.write_text(spec_hash)
+        os.replace(partial_file, hash_file)
+
+    def _model_group_deployments_exist(
+        self, namespace: str, model_group_names: List[str]
+    ) -> bool:
+        """
+        Checks that every model group still has its deployment in the cluster.
+
+        Args:
+            namespace (str): The namespace of the model groups.
+            model_group_names (List[str]): The names of the model groups.
+
+        Returns:
+            bool: True if all the deployments exist, False otherwise.
+        """
+        deployments = client.AppsV1Api().list_namespaced_deployment(namespace)
+        deployment_names = {
+            deployment.metadata.name
+            for deployment in deployments.items
+            if deployment.metadata
+        }
+        return all(kubify_name(name) in deployment_names for name in model_group_names)
+
+    def _model_groups_hash(self) -> str:
+        """
+        Hashes everything the model group resources are generated from.
+
+        The kubeconfig identifies the cluster, so a recreated cluster gets a new hash.
+
+        Returns:
+            str: The hex digest of the hash.
+        """
+        spec = json.dumps(
+            [
+                __version__,
+                self.cloud_config.model_dump(mode="json"),
+                self.ctx.kubeconfig,
+            ],
+            sort_keys=True,
+        )
+        return hashlib.sha256(spec.encode("utf-8")).hexdigest()
 
     def destroy(self) -> Any:
         logger.info("Destroying resources...")
-        return self._stack.destroy(on_output=logger.info)
+        with BufferedOutput() as on_output:
+            return self._stack.destroy(on_output=on_output)
 
     def refresh(self) -> None:
         logger.info("Refreshing the stack...")
-        self._stack.refresh(on_output=logger.info)
+        with BufferedOutput() as on_output:
+            self._stack.refresh(on_output=on_output)
 
     def preview(self, *args: Any, **kwargs: Any) -> None:
-        if not "on_output" in kwargs:
-            kwargs["on_output"] = logger.info
-        self._stack.preview(*args, **kwargs)
+        with BufferedOutput() as on_output:
+            if not "on_output" in kwargs:
+                kwargs["on_output"] = on_output
+            self._stack.preview(*args, **kwargs)
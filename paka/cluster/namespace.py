@@ -1,10 +1,8 @@
-import json
-
 import pulumi
 import pulumi_kubernetes as k8s
-from kubernetes import client, config
 
 from paka.cluster.context import Context
+from paka.k8s.utils import get_core_v1_api
 
 
 def create_namespace(ctx: Context, kubeconfig_json: str) -> None:
@@ -19,9 +17,8 @@ def create_namespace(ctx: Context, kubeconfig_json: str) -> None:
             opts=pulumi.ResourceOptions(provider=ctx.k8s_provider),
         )
     else:
-        config.load_kube_config_from_dict(json.loads(kubeconfig_json))
         # We are dealing with the default namespace
-        api_instance = client.CoreV1Api()
+        api_instance = get_core_v1_api(kubeconfig_json)
 
         body = {"metadata": {"labels": {"istio-injection": "enabled"}}}
 
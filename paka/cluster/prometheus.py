@@ -1,26 +1,17 @@
 from __future__ import annotations
 
-from typing import Any, Callable, Dict, Optional, Tuple
+from typing import Optional
 
 import pulumi
 import pulumi_kubernetes as k8s
 from pulumi_kubernetes.helm.v3 import Chart, ChartOpts, FetchOpts
 
 from paka.cluster.context import Context
+from paka.cluster.utils import strip_status
+from paka.utils import call_once
 
 
-def memoize(func: Callable[..., Any]) -> Callable[..., Any]:
-    cache: Dict[Callable[..., Any], Any] = dict()
-
-    def memoized_func(*args: Tuple[Any, ...], **kwargs: Dict[str, Any]) -> Any:
-        if func not in cache:
-            cache[func] = func(*args, **kwargs)
-        return cache[func]
-
-    return memoized_func
-
-
-@memoize
+@call_once
 def create_prometheus(ctx: Context) -> Optional[Chart]:
     """
     Installs a Prometheus chart.
@@ -112,6 +103,7 @@ def create_prometheus(ctx: Context) -> Optional[Chart]:
                     }
                 },
             },
+            transformations=[strip_status],
         ),
         opts=pulumi.ResourceOptions(provider=ctx.k8s_provider, depends_on=[ns]),
     )
@@ -1,3 +1,5 @@
+from typing import Any, Dict
+
 import pulumi
 import pulumi_kubernetes as k8s
 from pulumi_kubernetes.helm.v3 import Chart, ChartOpts, FetchOpts
@@ -5,6 +7,62 @@ from pulumi_kubernetes.helm.v3 import Chart, ChartOpts, FetchOpts
 from paka.cluster.context import Context
 from paka.utils import call_once
 
+# Chart values that don't depend on the vector store config
+_QDRANT_BASE_VALUES: Dict[str, Any] = {
+    "livenessProbe": {
+        "enabled": True,
+    },
+    "tolerations": [
+        {
+            "key": "app",
+            "operator": "Equal",
+            "value": "qdrant",
+            "effect": "NoSchedule",
+        }
+    ],
+    "affinity": {
+        "nodeAffinity": {
+            "requiredDuringSchedulingIgnoredDuringExecution": {
+                "nodeSelectorTerms": [
+                    {
+                        "matchExpressions": [
+                            {
+                                "key": "app",
+                                "operator": "In",
+                                "values": ["qdrant"],
+                            }
+                        ]
+                    }
+                ]
+            }
+        },
+        "podAntiAffinity": {
+            "requiredDuringSchedulingIgnoredDuringExecution": [
+                {
+                    "labelSelector": {
+                        "matchExpressions": [
+                            {
+                                "key": "app",
+                                "operator": "In",
+                                "values": ["qdrant"],
+                            }
+                        ]
+                    },
+                    "topologyKey": "kubernetes.io/hostname",
+                }
+            ]
+        },
+    },
+    "topologySpreadConstraints": [
+        {
+            "maxSkew": 1,
+            "topologyKey": "topology.kubernetes.io/zone",
+            "whenUnsatisfiable": "ScheduleAnyway",
+            "labelSelector": {"matchLabels": {"app": "qdrant"}},
+        }
+    ],
+}
+
 
 @call_once
 def create_qdrant(ctx: Context) -> None:
@@ -43,6 +101,7 @@ def create_qdrant(ctx: Context) -> None:
             namespace="qdrant",
             fetch_opts=FetchOpts(repo="https://qdrant.github.io/qdrant-helm"),
             values={
+                **_QDRANT_BASE_VALUES,
                 "metrics": {
                     "serviceMonitor": {
                         "enabled": (
@@ -56,58 +115,6 @@ def create_qdrant(ctx: Context) -> None:
                 "persistence": {
                     "size": config.vectorStore.storageSize,
                 },
-                "livenessProbe": {
-                    "enabled": True,
-                },
-                "tolerations": [
-                    {
-                        "key": "app",
-                        "operator": "Equal",
-                        "value": "qdrant",
-                        "effect": "NoSchedule",
-                    }
-                ],
-                "affinity": {
-                    "nodeAffinity": {
-                        "requiredDuringSchedulingIgnoredDuringExecution": {
-                            "nodeSelectorTerms": [
-                                {
-                                    "matchExpressions": [
-                                        {
-                                            "key": "app",
-                                            "operator": "In",
-                                            "values": ["qdrant"],
-                                        }
-                                    ]
-                                }
-                            ]
-                        }
-                    },
-                    "podAntiAffinity": {
-                        "requiredDuringSchedulingIgnoredDuringExecution": [
-                            {
-                                "labelSelector": {
-                                    "matchExpressions": [
-                                        {
-                                            "key": "app",
-                                            "operator": "In",
-                                            "values": ["qdrant"],
-                                        }
-                                    ]
-                                },
-                                "topologyKey": "kubernetes.io/hostname",
-                            }
-                        ]
-                    },
-                },
-                "topologySpreadConstraints": [
-                    {
-                        "maxSkew": 1,
-                        "topologyKey": "topology.kubernetes.io/zone",
-                        "whenUnsatisfiable": "ScheduleAnyway",
-                        "labelSelector": {"matchLabels": {"app": "qdrant"}},
-                    }
-                ],
                 **resource_request,
             },
         ),
@@ -1,21 +1,35 @@
+from typing import Any, Dict, Optional
+
 import pulumi
 import pulumi_kubernetes as k8s
 from pulumi_kubernetes.apiextensions import CustomResource
 from pulumi_kubernetes.helm.v3 import Chart, ChartOpts, FetchOpts
 
 from paka.cluster.context import Context
+from paka.cluster.utils import strip_status
 from paka.utils import call_once
 
+# Chart values that don't depend on the job config
+_REDIS_BASE_VALUES: Dict[str, Any] = {
+    "architecture": "standalone",
+    "metrics": {"enabled": True},  # For enabling metrics
+}
+
+# The chart turns on AOF by default. Snapshots (Redis' classic save points) are
+# enough to keep queued tasks across restarts without writing every command to
+# the append-only file.
+_REDIS_MASTER_CONFIGURATION = "appendonly no\nsave 900 1 300 10 60 10000\n"
+
 
 @call_once
-def create_redis(ctx: Context) -> None:
+def create_redis(ctx: Context) -> Optional[Chart]:
     """
     Installs redis with a helm chart.
     """
     config = ctx.cloud_config
 
     if not config.job or not config.job.enabled:
-        return
+        return None
 
     ns = k8s.core.v1.Namespace(
         "redis",
@@ -31,21 +45,25 @@ def create_redis(ctx: Context) -> None:
             namespace=ctx.namespace,
             fetch_opts=FetchOpts(repo="https://charts.bitnami.com/bitnami"),
             values={
-                "architecture": "standalone",
+                **_REDIS_BASE_VALUES,
                 "master": {
+                    "configuration": _REDIS_MASTER_CONFIGURATION,
                     "persistence": {
                         "enabled": True,
                         "size": config.job.brokerStorageSize,
                     },
                 },
-                "metrics": {"enabled": True},  # For enabling metrics
             },
+            # Nothing in the stack needs redis to be ready. Job workers retry until
+            # the broker is reachable.
+            skip_await=True,
+            transformations=[strip_status],
         ),
         opts=pulumi.ResourceOptions(provider=ctx.k8s_provider, depends_on=[ns]),
     )
 
     if not config.prometheus or not config.prometheus.enabled:
-        return
+        return chart
 
     CustomResource(
         "redis-metrics-monitor",
@@ -78,3 +96,5 @@ def create_redis(ctx: Context) -> None:
             depends_on=[chart],
         ),
     )
+
+    return chart
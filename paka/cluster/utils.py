@@ -1,5 +1,7 @@
 from typing import Any
 
+import pulumi
+
 from paka.cluster.context import Context
 from paka.model.store import ModelStore, S3ModelStore
 
@@ -8,3 +10,17 @@ def get_model_store(ctx: Context, *args: Any, **kwargs: Any) -> ModelStore:
     assert ctx.provider == "aws"
 
     return S3ModelStore(ctx.bucket, *args, **kwargs)
+
+
+def strip_status(obj: Any, opts: pulumi.ResourceOptions) -> None:
+    """
+    Drops the status field from a rendered manifest.
+
+    Status is owned by the API server and ignored on apply, so there is no point
+    in sending it to the engine with every resource.
+
+    Args:
+        obj (Any): The manifest object to transform.
+        opts (pulumi.ResourceOptions): The resource options.
+    """
+    obj.pop("status", None)
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import re
+from functools import lru_cache
 from typing import Any, Dict, Generic, List, Optional, TypeVar
 
 from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
@@ -10,6 +11,14 @@ from paka.utils import to_yaml
 
 CONFIG_VERSION = "1.3"
 
+# Comments aren't needed, so skip the round-trip loader. The safe loader also uses
+# the libyaml based ruamel.yaml.clib when it is installed.
+_YAML = YAML(typ="safe")
+
+_SIZE_RE = re.compile(r"^\d+(Mi|Gi)$")
+_CPU_RE = re.compile(r"^\d+(m)?$")
+_VERSION_RE = re.compile(r"^\d+\.\d+$")
+
 
 class PakaBaseModel(BaseModel):
     model_config = ConfigDict(extra="forbid")
@@ -29,7 +38,7 @@ def validate_size(v: str, error_message: str = "Invalid size format") -> str:
     Raises:
         ValueError: If the format of the input value is invalid. The error message is specified by the `error_message` parameter.
     """
-    if not re.match(r"^\d+(Mi|Gi)$", v):
+    if not _SIZE_RE.match(v):
         raise ValueError(error_message)
     return v
 
@@ -57,7 +66,7 @@ class ResourceRequest(PakaBaseModel):
         Raises:
             ValueError: If the format of the input value is invalid.
         """
-        if not re.match(r"^\d+(m)?$", v):
+        if not _CPU_RE.match(v):
             raise ValueError("Invalid CPU format")
         return v
 
@@ -250,16 +259,14 @@ class ScalingConfig(PakaBaseModel):
         ..., description="The maximum number of instances to provision."
     )
 
-    @model_validator(mode="before")
-    def check_instances_num(cls, values: Dict[str, int]) -> Dict[str, int]:
-        min_instances, max_instances = values.get("minInstances"), values.get(
-            "maxInstances"
-        )
-        if min_instances and max_instances and max_instances < min_instances:
+    @model_validator(mode="after")
+    def check_instances_num(self) -> ScalingConfig:
+        # Runs after field validation, so both values are ints (and 0 is checked too)
+        if self.maxInstances < self.minInstances:
             raise ValueError(
                 "maxInstances must be greater than or equal to minInstances"
             )
-        return values
+        return self
 
     @field_validator("minInstances", mode="before")
     def validate_min_instances(cls, v: int) -> int:
@@ -369,6 +376,8 @@ class ClusterConfig(PakaBaseModel):
     Represents the configuration for a cluster.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     name: str = Field(..., description="The name of the cluster.")
     region: str = Field(..., description="The default region for the cluster.")
     namespace: str = Field(
@@ -384,6 +393,12 @@ class ClusterConfig(PakaBaseModel):
     logRetentionDays: int = Field(
         14, description="The number of days to retain log entries."
     )
+    skipCheckpoints: Optional[bool] = Field(
+        None,
+        description="Skip persisting the Pulumi state after every resource operation. "
+        "Speeds up deployments of large stacks, but an interrupted deployment may leave "
+        "resources that are not recorded in the state.",
+    )
 
 
 class CloudVectorStore(CloudNode):
@@ -563,6 +578,8 @@ class CloudConfig(PakaBaseModel, Generic[T_OnDemandModelGroup, T_MixedModelGroup
     Represents the configuration for the cloud environment.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     cluster: ClusterConfig = Field(
         ..., description="The configuration for the Kubernetes cluster."
     )
@@ -594,24 +611,16 @@ class CloudConfig(PakaBaseModel, Generic[T_OnDemandModelGroup, T_MixedModelGroup
         description="The configuration for tracing. Default is None. If None, tracing is not enabled.",
     )
 
-    @model_validator(mode="before")
-    def check_model_group_names(cls, values: Dict[str, Any]) -> Dict[str, Any]:
+    @model_validator(mode="after")
+    def check_model_group_names(self) -> CloudConfig:
         # No model groups should have the same name
-        model_group_names = set()
-
-        for group in values.get("modelGroups", []):
-            group_name = dict(group)["name"]
-            if group_name in model_group_names:
-                raise ValueError(f"Duplicate model group names are not allowed")
-            model_group_names.add(group_name)
-
-        for mixed_group in values.get("mixedModelGroups", []):
-            mixed_group_name = dict(mixed_group)["name"]
-            if mixed_group_name in model_group_names:
-                raise ValueError(f"Duplicate model group names are not allowed")
-            model_group_names.add(mixed_group_name)
+        model_group_names = [group.name for group in self.modelGroups or []] + [
+            group.name for group in self.mixedModelGroups or []
+        ]
+        if len(model_group_names) != len(set(model_group_names)):
+            raise ValueError(f"Duplicate model group names are not allowed")
 
-        return values
+        return self
 
 
 class AwsConfig(CloudConfig[AwsModelGroup, AwsMixedModelGroup]):
@@ -631,6 +640,8 @@ class Config(PakaBaseModel):
     Configuration class for managing cloud cluster settings.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     version: str = Field(..., description="The version of the configuration.")
     aws: Optional[AwsConfig] = Field(None, description="The AWS cloud configuration.")
 
@@ -655,7 +666,7 @@ class Config(PakaBaseModel):
 
     @field_validator("version", mode="before")
     def validate_version(cls, v: str) -> str:
-        if not re.match(r"^\d+\.\d+$", v):
+        if not _VERSION_RE.match(v):
             raise ValueError('version must be in the format "x.x"')
         return v
 
@@ -670,7 +681,7 @@ def generate_yaml(config: Config) -> str:
     Returns:
         str: The YAML string representation of the config object.
     """
-    return to_yaml(config.model_dump(exclude_none=True))
+    return to_yaml(config.model_dump(exclude_none=True, mode="json"))
 
 
 def parse_yaml(yaml_str: str) -> Config:
@@ -683,13 +694,18 @@ def parse_yaml(yaml_str: str) -> Config:
     Returns:
         Config: The parsed Config object.
     """
-    yaml = YAML()
-    data = yaml.load(yaml_str)
+    return _parse_yaml(yaml_str)
+
+
+# Config is frozen, so the same object can be handed out for the same YAML
+@lru_cache(maxsize=32)
+def _parse_yaml(yaml_str: str) -> Config:
+    data = _YAML.load(yaml_str)
     version = data.get("version", None)
     if version is None:
         raise ValueError("Invalid configuration: The 'version' field is missing.")
 
-    if not re.match(r"^\d+\.\d+$", version):
+    if not _VERSION_RE.match(version):
         raise ValueError('version must be in the format "x.x"')
 
     # Make sure the major version matches
@@ -711,4 +727,4 @@ def parse_yaml(yaml_str: str) -> Config:
             " Please upgrade your tool to handle this configuration."
         )
 
-    return Config(**data)
+    return Config.model_validate(data)
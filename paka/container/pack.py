@@ -3,6 +3,7 @@ import platform
 import tarfile
 import tempfile
 import zipfile
+from functools import lru_cache
 from pathlib import Path
 
 import requests
@@ -16,6 +17,8 @@ from paka.utils import (
 )
 
 
+# Once installed, the pack binary doesn't move for the life of the process
+@lru_cache(maxsize=1)
 def ensure_pack() -> str:
     paka_home = Path(get_project_data_dir())
 
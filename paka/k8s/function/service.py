@@ -14,13 +14,16 @@ VALID_RESOURCES = ["cpu", "memory"]
 
 VALID_RESOURCES_GPU = ["nvidia.com/gpu"]
 
+_CPU_RE = re.compile(r"^\d+(m)?$")
+_MEMORY_RE = re.compile(r"^\d+(Mi|Gi)$")
+
 
 def validate_resource(resource: str, value: str) -> None:
     if resource == "cpu":
-        if not re.match(r"^\d+(m)?$", value):
+        if not _CPU_RE.match(value):
             raise ValueError("Invalid CPU value")
     elif resource == "memory":
-        if not re.match(r"^\d+(Mi|Gi)$", value):
+        if not _MEMORY_RE.match(value):
             raise ValueError("Invalid memory value")
     elif resource == "nvidia.com/gpu":
         if not value.isdigit() or int(value) < 1:
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import concurrent.futures
+import math
 import shlex
 import time
 from typing import Dict, Optional
@@ -11,6 +13,48 @@ from paka.k8s.job.autoscaler import create_autoscaler, delete_autoscaler
 from paka.k8s.utils import apply_resource, create_namespace
 from paka.logger import logger
 
+# Worker pods only run on job nodes
+_WORKER_TOLERATIONS = [
+    client.V1Toleration(
+        key="app",
+        operator="Equal",
+        value="job",
+        effect="NoSchedule",
+    )
+]
+
+# Prefer spot nodes and fall back to on-demand ones
+_WORKER_AFFINITY = client.V1Affinity(
+    node_affinity=client.V1NodeAffinity(
+        preferred_during_scheduling_ignored_during_execution=[
+            client.V1PreferredSchedulingTerm(
+                weight=100,
+                preference=client.V1NodeSelectorTerm(
+                    match_expressions=[
+                        client.V1NodeSelectorRequirement(
+                            key="lifecycle",
+                            operator="In",
+                            values=["spot"],
+                        )
+                    ]
+                ),
+            ),
+            client.V1PreferredSchedulingTerm(
+                weight=50,
+                preference=client.V1NodeSelectorTerm(
+                    match_expressions=[
+                        client.V1NodeSelectorRequirement(
+                            key="lifecycle",
+                            operator="In",
+                            values=["on-demand"],
+                        )
+                    ]
+                ),
+            ),
+        ]
+    ),
+)
+
 
 def wait_for_pods_to_drain(namespace: str, deployment_name: str) -> None:
     """
@@ -69,46 +113,6 @@ def create_deployment(
         ),
     ]
 
-    tolerations = [
-        client.V1Toleration(
-            key="app",
-            operator="Equal",
-            value="job",
-            effect="NoSchedule",
-        )
-    ]
-
-    affinity = client.V1Affinity(
-        node_affinity=client.V1NodeAffinity(
-            preferred_during_scheduling_ignored_during_execution=[
-                client.V1PreferredSchedulingTerm(
-                    weight=100,
-                    preference=client.V1NodeSelectorTerm(
-                        match_expressions=[
-                            client.V1NodeSelectorRequirement(
-                                key="lifecycle",
-                                operator="In",
-                                values=["spot"],
-                            )
-                        ]
-                    ),
-                ),
-                client.V1PreferredSchedulingTerm(
-                    weight=50,
-                    preference=client.V1NodeSelectorTerm(
-                        match_expressions=[
-                            client.V1NodeSelectorRequirement(
-                                key="lifecycle",
-                                operator="In",
-                                values=["on-demand"],
-                            )
-                        ]
-                    ),
-                ),
-            ]
-        ),
-    )
-
     deployment = client.V1Deployment(
         kind="Deployment",
         metadata=client.V1ObjectMeta(
@@ -136,8 +140,8 @@ def create_deployment(
                 spec=client.V1PodSpec(
                     service_account_name=service_account_name,
                     containers=containers,
-                    tolerations=tolerations,
-                    affinity=affinity,
+                    tolerations=_WORKER_TOLERATIONS,
+                    affinity=_WORKER_AFFINITY,
                 ),
             ),
         ),
@@ -145,6 +149,46 @@ def create_deployment(
     apply_resource(deployment)
 
 
+def get_trigger_queue_length(
+    tasks_per_worker: int,
+    per_worker_throughput: Optional[float] = None,
+    cold_start_seconds: Optional[float] = None,
+) -> int:
+    """
+    Computes the queue length at which the autoscaler adds a worker.
+
+    When both the per-worker throughput and the worker cold start time are known,
+    the threshold is the number of tasks one worker gets through while a new one
+    is starting. A lower threshold makes the autoscaler flap around the steady
+    state, and a higher one lets the queue pile up before a new worker is ready.
+
+    Args:
+        tasks_per_worker (int): The threshold to use when neither throughput nor cold
+            start time is given.
+        per_worker_throughput (Optional[float]): The tasks one worker handles per second.
+        cold_start_seconds (Optional[float]): The seconds it takes a new worker to
+            start taking tasks.
+
+    Returns:
+        int: The queue length that triggers scaling, at least 1.
+
+    Raises:
+        ValueError: If only one of throughput and cold start time is given, or if
+            either is not positive.
+    """
+    if per_worker_throughput is None and cold_start_seconds is None:
+        return tasks_per_worker
+    if per_worker_throughput is None or cold_start_seconds is None:
+        raise ValueError(
+            "Per-worker throughput and cold start time must be given together."
+        )
+    if per_worker_throughput <= 0 or cold_start_seconds <= 0:
+        raise ValueError(
+            "Per-worker throughput and cold start time must be greater than 0."
+        )
+    return max(1, math.ceil(per_worker_throughput * cold_start_seconds))
+
+
 def create_workers(
     namespace: str,
     job_name: str,
@@ -156,7 +200,15 @@ def create_workers(
     envs: Optional[Dict[str, str]] = None,
     resource_requests: Optional[Dict[str, str]] = None,
     resource_limits: Optional[Dict[str, str]] = None,
+    per_worker_throughput: Optional[float] = None,
+    cold_start_seconds: Optional[float] = None,
+    polling_interval_seconds: int = 10,
+    cooldown_seconds: int = 300,
 ) -> None:
+    trigger_queue_length = get_trigger_queue_length(
+        tasks_per_worker, per_worker_throughput, cold_start_seconds
+    )
+
     create_namespace(namespace)
 
     deployment_name = job_name
@@ -166,27 +218,39 @@ def create_workers(
         # Wait for pods to drain
         wait_for_pods_to_drain(namespace, deployment_name)
 
-    # Otherwise, upsert the deployment. This will update the deployment if it already exists.
-    create_deployment(
-        entrypoint,
-        namespace,
-        deployment_name,
-        ACCESS_ALL_SA,
-        image,
-        envs,
-        resource_requests,
-        resource_limits,
-    )
-
-    create_autoscaler(
-        namespace=namespace,
-        redis_svc_name="redis-master",
-        queue_name="celery",
-        trigger_queue_length=tasks_per_worker,
-        job_name=deployment_name,
-        min_replicas=0,  # Hard coded, scale to 0
-        max_replicas=max_replicas,
-    )
+    # The deployment and its autoscaler are separate API objects. KEDA picks up the
+    # deployment whenever it shows up, so both are applied at once.
+    with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+        futures = [
+            # Otherwise, upsert the deployment. This will update the deployment if it
+            # already exists.
+            executor.submit(
+                create_deployment,
+                entrypoint,
+                namespace,
+                deployment_name,
+                ACCESS_ALL_SA,
+                image,
+                envs,
+                resource_requests,
+                resource_limits,
+            ),
+            executor.submit(
+                create_autoscaler,
+                namespace=namespace,
+                redis_svc_name="redis-master",
+                queue_name="celery",
+                trigger_queue_length=trigger_queue_length,
+                job_name=deployment_name,
+                min_replicas=0,  # Hard coded, scale to 0
+                max_replicas=max_replicas,
+                polling_interval_seconds=polling_interval_seconds,
+                cooldown_seconds=cooldown_seconds,
+            ),
+        ]
+        for future in concurrent.futures.as_completed(futures):
+            # Surface the first failure
+            future.result()
 
 
 def delete_workers(
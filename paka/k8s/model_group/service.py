@@ -1,10 +1,8 @@
 from __future__ import annotations
 
-import json
 from typing import Any, Dict, List, Optional, Tuple, Union, cast
 
 from kubernetes import client
-from kubernetes import config as k8s_config
 
 from paka.cluster.context import Context
 from paka.cluster.utils import get_model_store
@@ -587,28 +585,17 @@ def create_scaled_object(
     )
 
 
-def create_model_group_service(
-    ctx: Context,
-    namespace: str,
-    model_group: T_OnDemandModelGroup,
-) -> None:
+def save_model_to_store(ctx: Context, model_group: CloudModelGroup) -> None:
     """
-    Creates a Kubernetes service for a machine learning model group.
+    Saves the model of a model group to the model store, unless it is already there.
 
     Args:
-        namespace (str): The namespace to create the service in.
-        config (Config): The configuration for the service.
-        model_group (T_CloudModelGroup): The model group to create the service for.
-
-    Raises:
-        ValueError: If the AWS configuration is not provided.
+        ctx (Context): The cluster context.
+        model_group (CloudModelGroup): The model group whose model to save.
 
     Returns:
         None
     """
-    k8s_config.load_kube_config_from_dict(json.loads(ctx.kubeconfig))
-
-    config = ctx.cloud_config
     # Download the model to S3 first
     if model_group.model and model_group.model.useModelStore:
         if model_group.model.hfRepoId:
@@ -628,6 +615,31 @@ def create_model_group_service(
                     f"Model {model_group.name} already exists in the model store. Skipping download."
                 )
 
+
+def create_model_group_service(
+    ctx: Context,
+    namespace: str,
+    model_group: T_OnDemandModelGroup,
+) -> None:
+    """
+    Creates a Kubernetes service for a machine learning model group.
+
+    Args:
+        namespace (str): The namespace to create the service in.
+        config (Config): The configuration for the service.
+        model_group (T_CloudModelGroup): The model group to create the service for.
+
+    The kubeconfig must already be loaded, and the model saved to the model store
+    with save_model_to_store.
+
+    Raises:
+        ValueError: If the AWS configuration is not provided.
+
+    Returns:
+        None
+    """
+    config = ctx.cloud_config
+
     port = 8000
 
     pod = create_pod(
@@ -8,14 +8,10 @@ c) Once the spot instance pool has capacity, the on-demand pods (except the fail
 
 from __future__ import annotations
 
-import json
-
 from kubernetes import client
-from kubernetes import config as k8s_config
 from kubernetes.client.exceptions import ApiException
 
 from paka.cluster.context import Context
-from paka.cluster.utils import get_model_store
 from paka.config import T_MixedModelGroup
 from paka.k8s.model_group.ingress import create_model_vservice
 from paka.k8s.model_group.service import (
@@ -25,8 +21,6 @@ from paka.k8s.model_group.service import (
     create_service_monitor,
 )
 from paka.k8s.utils import apply_resource
-from paka.logger import logger
-from paka.model.hf_model import HuggingFaceModel
 from paka.utils import kubify_name
 
 
@@ -209,33 +203,16 @@ def create_model_group_service(
         config (Config): The configuration for the service.
         model_group (T_CloudModelGroup): The model group to create the service for.
 
+    The kubeconfig must already be loaded, and the model saved to the model store
+    with save_model_to_store.
+
     Raises:
         ValueError: If the AWS configuration is not provided.
 
     Returns:
         None
     """
-    k8s_config.load_kube_config_from_dict(json.loads(ctx.kubeconfig))
-
     config = ctx.cloud_config
-    # Download the model to S3 first
-    if model_group.model and model_group.model.useModelStore:
-        if model_group.model.hfRepoId:
-            model = HuggingFaceModel(
-                name=model_group.name,
-                repo_id=model_group.model.hfRepoId,
-                files=model_group.model.files,
-                model_store=get_model_store(ctx),
-            )
-            # If the model is not already in the model store, save it
-            # That means users cannot update the model in the model store
-            # They have to create a new model group or delete the old one
-            if not model.model_store.glob(f"{model_group.name}/*"):
-                model.save()
-            else:
-                logger.info(
-                    f"Model {model_group.name} already exists in the model store. Skipping download."
-                )
 
     port = 8000
 
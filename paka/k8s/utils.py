@@ -1,17 +1,17 @@
 from __future__ import annotations
 
 import contextlib
+import json
 import os
 import re
 import select
 import socket
 import threading
 import time
-from functools import partial
 from typing import Any, Callable, Dict, List, Literal, Optional, Protocol, Tuple
 
 from kubernetes import watch  # type: ignore
-from kubernetes import client
+from kubernetes import client, config
 from kubernetes.client.exceptions import ApiException
 from kubernetes.stream import portforward
 from ruamel.yaml import YAML
@@ -84,7 +84,7 @@ def create_namespaced_custom_object(namespace: str, resource: CustomResource) ->
     if resource.status is not None:
         body["status"] = resource.status
 
-    api_instance = client.CustomObjectsApi()
+    api_instance = client.CustomObjectsApi(get_api_client())
 
     return api_instance.create_namespaced_custom_object(
         group=resource.group,
@@ -98,7 +98,7 @@ def create_namespaced_custom_object(namespace: str, resource: CustomResource) ->
 def read_namespaced_custom_object(
     name: str, namespace: str, resource: CustomResource
 ) -> Any:
-    api_instance = client.CustomObjectsApi()
+    api_instance = client.CustomObjectsApi(get_api_client())
     return api_instance.get_namespaced_custom_object(
         group=resource.group,
         version=resource.version,
@@ -124,7 +124,7 @@ def replace_namespaced_custom_object(
         },
         "spec": resource.spec,
     }
-    api_instance = client.CustomObjectsApi()
+    api_instance = client.CustomObjectsApi(get_api_client())
     return api_instance.replace_namespaced_custom_object(
         group=resource.group,
         version=resource.version,
@@ -138,7 +138,7 @@ def replace_namespaced_custom_object(
 def delete_namespaced_custom_object(
     name: str, namespace: str, resource: CustomResource
 ) -> Any:
-    api_instance = client.CustomObjectsApi()
+    api_instance = client.CustomObjectsApi(get_api_client())
     return api_instance.delete_namespaced_custom_object(
         group=resource.group,
         version=resource.version,
@@ -149,7 +149,7 @@ def delete_namespaced_custom_object(
 
 
 def list_namespaced_custom_object(namespace: str, resource: CustomResource) -> Any:
-    api_instance = client.CustomObjectsApi()
+    api_instance = client.CustomObjectsApi(get_api_client())
     custom_resources = api_instance.list_namespaced_custom_object(
         group=resource.group,
         version=resource.version,
@@ -189,22 +189,19 @@ def apply_resource(
         raise ValueError("Namespace is required")
 
     if kind == "Deployment":
-        apps_v1_api = client.AppsV1Api()
+        apps_v1_api = client.AppsV1Api(get_api_client())
         create_method: Callable[..., Any] = apps_v1_api.create_namespaced_deployment
         replace_method: Callable[..., Any] = apps_v1_api.replace_namespaced_deployment
-        read_method: Callable[..., Any] = apps_v1_api.read_namespaced_deployment
     elif kind == "Service":
-        core_v1_api = client.CoreV1Api()
+        core_v1_api = client.CoreV1Api(get_api_client())
         create_method = core_v1_api.create_namespaced_service
         replace_method = core_v1_api.replace_namespaced_service
-        read_method = core_v1_api.read_namespaced_service
     elif kind == "HorizontalPodAutoscaler":
-        auto_scaling_v2_api = client.AutoscalingV2Api()
+        auto_scaling_v2_api = client.AutoscalingV2Api(get_api_client())
         create_method = auto_scaling_v2_api.create_namespaced_horizontal_pod_autoscaler
         replace_method = (
             auto_scaling_v2_api.replace_namespaced_horizontal_pod_autoscaler
         )
-        read_method = auto_scaling_v2_api.read_namespaced_horizontal_pod_autoscaler
     elif kind in [
         "ScaledObject",
         "TriggerAuthentication",
@@ -217,38 +214,33 @@ def apply_resource(
     ]:
         create_method = create_namespaced_custom_object
         replace_method = replace_namespaced_custom_object
-        read_method = partial(read_namespaced_custom_object, resource=resource)
     elif kind == "ServiceAccount":
-        core_v1_api = client.CoreV1Api()
+        core_v1_api = client.CoreV1Api(get_api_client())
         create_method = core_v1_api.create_namespaced_service_account
         replace_method = core_v1_api.patch_namespaced_service_account
-        read_method = core_v1_api.read_namespaced_service_account
     elif kind == "Secret":
-        core_v1_api = client.CoreV1Api()
+        core_v1_api = client.CoreV1Api(get_api_client())
         create_method = core_v1_api.create_namespaced_secret
         replace_method = core_v1_api.patch_namespaced_secret
-        read_method = core_v1_api.read_namespaced_secret
     elif kind == "RoleBinding":
-        rbac_authorization_v1_api = client.RbacAuthorizationV1Api()
+        rbac_authorization_v1_api = client.RbacAuthorizationV1Api(get_api_client())
         create_method = rbac_authorization_v1_api.create_namespaced_role_binding
         replace_method = rbac_authorization_v1_api.patch_namespaced_role_binding
-        read_method = rbac_authorization_v1_api.read_namespaced_role_binding
     elif kind == "Role":
-        rbac_authorization_v1_api = client.RbacAuthorizationV1Api()
+        rbac_authorization_v1_api = client.RbacAuthorizationV1Api(get_api_client())
         create_method = rbac_authorization_v1_api.create_namespaced_role
         replace_method = rbac_authorization_v1_api.patch_namespaced_role
-        read_method = rbac_authorization_v1_api.read_namespaced_role
     elif kind == "ConfigMap":
-        core_v1_api = client.CoreV1Api()
+        core_v1_api = client.CoreV1Api(get_api_client())
         create_method = core_v1_api.create_namespaced_config_map
         replace_method = core_v1_api.patch_namespaced_config_map
-        read_method = core_v1_api.read_namespaced_config_map
     else:
         raise ValueError(f"Unsupported kind: {kind}")
 
-    # Try to read (get) the resource; if it exists, replace it, otherwise create it
+    # Update the resource in place, and only create it if it doesn't exist yet. This
+    # saves reading the resource first, since the update fails with a 404 when it's
+    # missing.
     try:
-        read_method(resource.metadata.name, namespace)
         response = replace_method(resource.metadata.name, namespace, resource)
         logger.info(f"{kind} '{resource.metadata.name}' updated.")
     except ApiException as e:
@@ -273,7 +265,7 @@ def create_namespace(name: str) -> None:
     Raises:
         ApiException: If an error occurs while creating the namespace.
     """
-    api = client.CoreV1Api()
+    api = client.CoreV1Api(get_api_client())
     namespace = client.V1Namespace(metadata=client.V1ObjectMeta(name=name))
     try:
         api.create_namespace(body=namespace)
@@ -596,6 +588,53 @@ def update_kubeconfig(kubeconfig: Dict[str, Any]) -> None:
         yaml.dump(sorted_config, file)
 
 
+_api_client: Optional[client.ApiClient] = None
+_api_client_config: Any = None
+_api_client_lock = threading.Lock()
+
+
+def get_api_client() -> client.ApiClient:
+    """
+    Returns an ApiClient shared by the resource helpers in this module.
+
+    Each ApiClient() deep copies the default configuration and opens its own connection
+    pool, so building one per call means a new TLS handshake per request. The shared
+    client is rebuilt whenever a kubeconfig is loaded as the new default.
+
+    Streaming calls (port forwarding, exec) swap out the client's request method while
+    they run, so they must keep using their own clients.
+
+    Returns:
+        client.ApiClient: The shared API client.
+    """
+    global _api_client, _api_client_config
+
+    # load_kube_config stores a fresh copy as the default on every load
+    default_config = getattr(client.Configuration, "_default", None)
+    with _api_client_lock:
+        if _api_client is None or _api_client_config is not default_config:
+            _api_client = client.ApiClient()
+            _api_client_config = default_config
+        return _api_client
+
+
+def get_core_v1_api(kubeconfig_json: str) -> client.CoreV1Api:
+    """
+    Loads the kubeconfig as the default configuration and returns a CoreV1Api client.
+
+    Other callers of the kubernetes client rely on the kubeconfig being the default.
+    The returned client uses the shared client of get_api_client.
+
+    Args:
+        kubeconfig_json (str): The kubeconfig in JSON format.
+
+    Returns:
+        client.CoreV1Api: The API client.
+    """
+    config.load_kube_config_from_dict(json.loads(kubeconfig_json))
+    return client.CoreV1Api(get_api_client())
+
+
 def tail_logs(namespace: str, pod_name: str, container_name: str) -> None:
     v1 = client.CoreV1Api()
     w = watch.Watch()
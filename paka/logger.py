@@ -1,4 +1,8 @@
+from __future__ import annotations
+
 import logging
+from threading import Lock, Timer
+from typing import Any, Callable, List, Optional
 
 # Create a logger
 logger = logging.getLogger(__name__)
@@ -27,3 +31,54 @@ def setup_logger(verbose: bool = False, format: str = "%(message)s") -> None:
 
 
 setup_logger()
+
+
+class BufferedOutput:
+    """
+    Collects output lines and logs them in batches.
+
+    Pulumi reports every line of its output separately. Batching the lines keeps the
+    logging overhead low for large stacks. Lines are logged at the latest after
+    `flush_interval` seconds, so a slow step doesn't hold back its output.
+    """
+
+    def __init__(
+        self,
+        log: Callable[[str], None] = logger.info,
+        max_lines: int = 64,
+        flush_interval: float = 0.05,
+    ) -> None:
+        self._log = log
+        self._max_lines = max_lines
+        self._flush_interval = flush_interval
+        self._lines: List[str] = []
+        self._lock = Lock()
+        self._timer: Optional[Timer] = None
+
+    def __call__(self, line: str) -> None:
+        with self._lock:
+            self._lines.append(line)
+            if len(self._lines) >= self._max_lines:
+                self._flush()
+            elif self._timer is None:
+                self._timer = Timer(self._flush_interval, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+
+    def __enter__(self) -> BufferedOutput:
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.flush()
+
+    def flush(self) -> None:
+        with self._lock:
+            self._flush()
+
+    def _flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if self._lines:
+            self._log("\n".join(self._lines))
+            self._lines = []
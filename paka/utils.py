@@ -5,14 +5,18 @@ import json
 import os
 import random
 import re
+import shutil
 import string
+import tarfile
 import tempfile
+import threading
 from contextlib import contextmanager
 from enum import Enum
 from functools import lru_cache, wraps
 from io import StringIO
 from pathlib import Path
 from typing import Any, Callable, Dict, Generator, Optional, TypeVar, cast
+from urllib.parse import urljoin
 
 import boto3
 import requests
@@ -102,15 +106,31 @@ def get_project_data_dir() -> str:
 def call_once(func: T) -> T:
     """
     Decorator to ensure a function is only executed once.
+
+    Subsequent calls return the result of the first call. Callers on other threads
+    wait for the first call to finish instead of running the function again. A call
+    that reaches the function again through its own call chain returns None right away
+    instead of recursing or deadlocking. If the first call raises, the next call runs
+    the function again.
     """
     has_been_called = False
+    is_running = False
+    result: Any = None
+    # Reentrant, so that a nested call on the same thread doesn't block on itself
+    lock = threading.RLock()
 
     @wraps(func)
     def wrapper(*args: Any, **kwargs: Any) -> Any:
-        nonlocal has_been_called
-        if not has_been_called:
-            has_been_called = True
-            return func(*args, **kwargs)
+        nonlocal has_been_called, is_running, result
+        with lock:
+            if not has_been_called and not is_running:
+                is_running = True
+                try:
+                    result = func(*args, **kwargs)
+                    has_been_called = True
+                finally:
+                    is_running = False
+        return result
 
     return cast(T, wrapper)
 
@@ -279,14 +299,140 @@ def download_url(url: str) -> Generator[str, None, None]:
                 for chunk in r.iter_content(chunk_size=8192):
                     tf.write(chunk)
 
-            tf.flush()
-            os.fsync(tf.fileno())
-
+        # No fsync, the file is read back right away and removed afterwards. Closing
+        # it is enough for readers in this process to see the data.
         yield tmp_file
     finally:
         os.remove(tmp_file)
 
 
+def download_cached_url(url: str, cache_dir: Optional[str] = None) -> str:
+    """
+    Download a file from a URL into a local cache and return the path to the cached file.
+
+    Files are keyed by their URL, so a file is only downloaded the first time its URL is
+    requested. URLs are expected to point to immutable content, e.g. a pinned release.
+
+    Args:
+        url (str): The URL of the file to be downloaded.
+        cache_dir (Optional[str], optional): The cache directory. Defaults to the "cache"
+            directory under the project data directory.
+
+    Returns:
+        str: The path to the cached file.
+    """
+    if cache_dir is None:
+        cache_dir = os.path.join(get_project_data_dir(), "cache")
+
+    url_hash = hashlib.sha256(url.encode("utf-8")).hexdigest()[:16]
+    cached_file = Path(cache_dir) / url_hash / url.rstrip("/").split("/")[-1]
+
+    if cached_file.exists():
+        return str(cached_file)
+
+    cached_file.parent.mkdir(parents=True, exist_ok=True)
+    with download_url(url) as tmp_file:
+        # Copy next to the target first so that the file shows up atomically
+        partial_file = cached_file.with_name(f"{cached_file.name}.partial")
+        shutil.copyfile(tmp_file, partial_file)
+        os.replace(partial_file, cached_file)
+
+    return str(cached_file)
+
+
+def extract_tar_safely(tar: tarfile.TarFile, path: str) -> None:
+    """
+    Extract a tar archive, refusing members that would land outside of the target.
+
+    Args:
+        tar (tarfile.TarFile): The archive to extract.
+        path (str): The directory to extract into.
+
+    Raises:
+        Exception: If a member has an absolute path, escapes the directory, or is a
+            link or device file.
+    """
+    if hasattr(tarfile, "data_filter"):
+        tar.extractall(path, filter="data")
+        return
+
+    # Python without extraction filters
+    root = os.path.realpath(path)
+    for member in tar.getmembers():
+        target = os.path.realpath(os.path.join(root, member.name))
+        if (
+            os.path.isabs(member.name)
+            or os.path.commonpath([root, target]) != root
+            or not (member.isfile() or member.isdir())
+        ):
+            raise Exception(f"Refusing to extract {member.name}")
+    tar.extractall(path)
+
+
+def download_cached_chart(
+    repo: str, chart: str, version: str, cache_dir: Optional[str] = None
+) -> str:
+    """
+    Download a Helm chart into a local cache and return the path to the unpacked chart.
+
+    The repository index is only read when the chart version is not cached yet, to find
+    the chart archive and its digest. Later calls don't touch the network.
+
+    Args:
+        repo (str): The URL of the chart repository.
+        chart (str): The name of the chart.
+        version (str): The chart version.
+        cache_dir (Optional[str], optional): The cache directory. Defaults to the "cache"
+            directory under the project data directory.
+
+    Returns:
+        str: The path to the chart directory, i.e. the directory containing Chart.yaml.
+    """
+    if cache_dir is None:
+        cache_dir = os.path.join(get_project_data_dir(), "cache")
+
+    repo = repo.rstrip("/")
+    repo_hash = hashlib.sha256(repo.encode("utf-8")).hexdigest()[:16]
+    chart_root = Path(cache_dir) / repo_hash / f"{chart}-{version}"
+
+    if not chart_root.exists():
+        response = requests.get(f"{repo}/index.yaml")
+        response.raise_for_status()
+        index = YAML(typ="safe").load(response.text)
+
+        entry = next(
+            (e for e in index["entries"].get(chart, []) if e["version"] == version),
+            None,
+        )
+        if entry is None:
+            raise Exception(f"Chart {chart} {version} not found in {repo}")
+
+        chart_root.parent.mkdir(parents=True, exist_ok=True)
+        with download_url(urljoin(f"{repo}/", entry["urls"][0])) as archive_file:
+            archive_sha256 = calculate_sha256(archive_file)
+            if "digest" in entry and archive_sha256 != entry["digest"]:
+                raise Exception(
+                    f"SHA256 mismatch: {archive_sha256} != {entry['digest']}"
+                )
+
+            tmp_dir = tempfile.mkdtemp(dir=chart_root.parent)
+            try:
+                with tarfile.open(archive_file, "r:gz") as tar:
+                    extract_tar_safely(tar, tmp_dir)
+                os.replace(tmp_dir, chart_root)
+            except OSError:
+                shutil.rmtree(tmp_dir, ignore_errors=True)
+                # Another run unpacked the chart first, use theirs
+                if not chart_root.exists():
+                    raise
+            except Exception:
+                shutil.rmtree(tmp_dir, ignore_errors=True)
+                raise
+
+    # A packaged chart has a single top-level directory named after the chart
+    return str(chart_root / chart)
+
+
 class PulumiStackKey(Enum):
     NAMESPACE = "namespace"
     REGION = "region"
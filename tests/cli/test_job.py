@@ -0,0 +1,22 @@
+import pytest
+import typer
+
+from paka.cli.job import validate_worker_scaling
+
+
+def test_validate_worker_scaling() -> None:
+    # Test valid input
+    validate_worker_scaling(None, None)
+    validate_worker_scaling(2, 30)
+
+    # Test only one of the two
+    with pytest.raises(typer.BadParameter):
+        validate_worker_scaling(2, None)
+    with pytest.raises(typer.BadParameter):
+        validate_worker_scaling(None, 30)
+
+    # Test values that are not positive
+    with pytest.raises(typer.BadParameter):
+        validate_worker_scaling(0, 30)
+    with pytest.raises(typer.BadParameter):
+        validate_worker_scaling(2, -1)
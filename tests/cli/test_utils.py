@@ -91,6 +91,7 @@ def test_init_pulumi() -> None:
 
         assert os.environ["PULUMI_CONFIG_PASSPHRASE"] == "test_passphrase"
         assert os.environ["PULUMI_BACKEND_URL"] == "test_backend_url"
+        assert os.environ["PULUMI_SKIP_UPDATE_CHECK"] == "true"
 
         mock_makedirs.assert_called_once()
 
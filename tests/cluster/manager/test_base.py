@@ -0,0 +1,147 @@
+import os
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from paka.cluster.manager.base import ClusterManager
+from paka.config import (
+    AwsConfig,
+    AwsMixedModelGroup,
+    AwsModelGroup,
+    ClusterConfig,
+    Config,
+    ResourceRequest,
+    Runtime,
+    ScalingConfigNonZero,
+)
+from paka.constants import HOME_ENV_VAR
+
+config = Config(
+    version="1.0",
+    aws=AwsConfig(
+        cluster=ClusterConfig(
+            name="test-cluster",
+            region="us-east-1",
+            nodeType="t2.micro",
+            minNodes=2,
+            maxNodes=2,
+            namespace="default",
+        ),
+        modelGroups=[
+            AwsModelGroup(
+                name="test-model-group",
+                minInstances=1,
+                maxInstances=2,
+                nodeType="t2.micro",
+                runtime=Runtime(image="test-image"),
+                resourceRequest=ResourceRequest(cpu="500m", memory="2Gi"),
+            )
+        ],
+    ),
+)
+
+
+class FakeClusterManager(ClusterManager):
+    def provision_k8s(self) -> None:
+        pass
+
+
+def test_create_skips_unchanged_model_groups(tmp_path: Path) -> None:
+    manager = FakeClusterManager(config)
+    manager.ctx.set_kubeconfig("{}")
+    # Bypass the pulumi stack
+    manager.__dict__["_stack"] = MagicMock()
+
+    deployment = MagicMock()
+    deployment.metadata.name = "test-model-group"
+
+    with patch.dict(os.environ, {HOME_ENV_VAR: str(tmp_path)}), patch(
+        "paka.cluster.manager.base.k8s_config.load_kube_config_from_dict"
+    ), patch("paka.cluster.manager.base.save_model_to_store"), patch(
+        "paka.cluster.manager.base.cleanup_staled_model_group_services"
+    ) as mock_cleanup, patch(
+        "paka.cluster.manager.base.create_model_group_service"
+    ) as mock_create, patch(
+        "paka.cluster.manager.base.client.AppsV1Api"
+    ) as mock_apps_api:
+        list_deployments = mock_apps_api.return_value.list_namespaced_deployment
+        list_deployments.return_value.items = [deployment]
+
+        manager.create()
+        assert mock_create.call_count == 1
+
+        # Unchanged, only the stale services are cleaned up
+        manager.create()
+        assert mock_create.call_count == 1
+        assert mock_cleanup.call_count == 2
+
+        # Forced
+        manager.create(force=True)
+        assert mock_create.call_count == 2
+
+        # A deployment removed out-of-band is re-created
+        list_deployments.return_value.items = []
+        manager.create()
+        assert mock_create.call_count == 3
+
+
+def test_create_model_groups(tmp_path: Path) -> None:
+    assert config.aws
+    mixed_config = config.model_copy(
+        update={
+            "aws": config.aws.model_copy(
+                update={
+                    "mixedModelGroups": [
+                        AwsMixedModelGroup(
+                            name="test-mixed-model-group",
+                            nodeType="t2.micro",
+                            runtime=Runtime(image="test-image"),
+                            baseInstances=1,
+                            maxOnDemandInstances=2,
+                            spot=ScalingConfigNonZero(minInstances=1, maxInstances=2),
+                        )
+                    ]
+                }
+            )
+        }
+    )
+    manager = FakeClusterManager(mixed_config)
+    manager.ctx.set_kubeconfig('{"kind": "Config"}')
+    manager.__dict__["_stack"] = MagicMock()
+
+    calls = MagicMock()
+    with patch.dict(os.environ, {HOME_ENV_VAR: str(tmp_path)}), patch(
+        "paka.cluster.manager.base.cleanup_staled_model_group_services"
+    ), patch(
+        "paka.cluster.manager.base.k8s_config.load_kube_config_from_dict",
+        calls.load,
+    ), patch(
+        "paka.cluster.manager.base.save_model_to_store", calls.save
+    ), patch(
+        "paka.cluster.manager.base.create_model_group_service", calls.create
+    ), patch(
+        "paka.cluster.manager.base.create_model_group_service_v1", calls.create_v1
+    ):
+        manager.create()
+
+        # The kubeconfig is loaded once, before any worker thread starts
+        calls.load.assert_called_once_with({"kind": "Config"})
+        assert calls.method_calls[0][0] == "load"
+
+        # Models are saved before any resources are applied
+        names = [call[0] for call in calls.method_calls[1:]]
+        assert names[:2] == ["save", "save"]
+        assert sorted(names[2:]) == ["create", "create_v1"]
+        assert [call.args[1].name for call in calls.save.call_args_list] == [
+            "test-model-group",
+            "test-mixed-model-group",
+        ]
+
+        # The first failure is surfaced, and the hash is not written
+        hash_file = tmp_path / "clusters" / "test-cluster" / "model_groups.sha256"
+        hash_file.unlink()
+        calls.create_v1.side_effect = RuntimeError("boom")
+        with pytest.raises(RuntimeError, match="boom"):
+            manager.create()
+        assert not hash_file.exists()
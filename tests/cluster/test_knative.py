@@ -0,0 +1,90 @@
+from pathlib import Path
+
+from pulumi import ResourceOptions
+
+from paka.cluster.knative import exclude_knative_eventing_namespace, split_crd_documents
+
+
+def test_split_crd_documents(tmp_path: Path) -> None:
+    yaml_file = tmp_path / "istio.yaml"
+    yaml_file.write_text(
+        """# Copyright header
+---
+apiVersion: apiextensions.k8s.io/v1
+kind: CustomResourceDefinition
+metadata:
+  name: gateways.networking.istio.io
+  labels:
+    knative.dev/crd-install: "true"
+---
+apiVersion: v1
+kind: ServiceAccount
+metadata:
+  name: istiod
+  namespace: istio-system
+---
+apiVersion: v1
+kind: Namespace
+metadata:
+  name: istio-system
+  labels:
+    knative.dev/crd-install: "false"
+---
+# Only a comment
+---
+apiVersion: apps/v1
+kind: Deployment
+metadata:
+  name: istiod
+  namespace: istio-system
+spec:
+  selector:
+    matchLabels:
+      knative.dev/crd-install: "true"
+  template:
+    metadata:
+      labels:
+        knative.dev/crd-install: "true"
+---
+apiVersion: apiextensions.k8s.io/v1
+kind: CustomResourceDefinition
+metadata:
+  name: peerauthentications.security.istio.io
+  labels:
+    knative.dev/crd-install: 'true'
+"""
+    )
+
+    crd_yaml, non_crd_yaml = split_crd_documents(str(yaml_file))
+
+    assert "gateways.networking.istio.io" in crd_yaml
+    assert "peerauthentications.security.istio.io" in crd_yaml
+    assert "kind: ServiceAccount" not in crd_yaml
+    assert "kind: CustomResourceDefinition" not in non_crd_yaml
+    assert "kind: ServiceAccount" in non_crd_yaml
+    assert "kind: Namespace" in non_crd_yaml
+    # The label only counts in the top-level metadata
+    assert "kind: Deployment" in non_crd_yaml
+    assert "kind: Deployment" not in crd_yaml
+    assert "Only a comment" not in crd_yaml + non_crd_yaml
+
+
+def test_exclude_knative_eventing_namespace() -> None:
+    eventing = {
+        "kind": "ServiceMonitor",
+        "metadata": {"name": "broker", "namespace": "knative-eventing"},
+    }
+    exclude_knative_eventing_namespace(eventing, ResourceOptions())
+    assert eventing["kind"] == "List"
+    assert eventing["items"] == []
+
+    serving = {
+        "kind": "ServiceMonitor",
+        "metadata": {"name": "activator", "namespace": "knative-serving"},
+    }
+    exclude_knative_eventing_namespace(serving, ResourceOptions())
+    assert serving["kind"] == "ServiceMonitor"
+
+    cluster_scoped = {"kind": "ClusterRole", "metadata": {"name": "monitoring"}}
+    exclude_knative_eventing_namespace(cluster_scoped, ResourceOptions())
+    assert cluster_scoped["kind"] == "ClusterRole"
@@ -0,0 +1,43 @@
+import os
+import time
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import requests
+
+from paka.cluster.kubectl import (
+    KUBECTL_VERSION_CACHE_TTL,
+    get_kubectl_version,
+    get_latest_kubectl_version,
+)
+from paka.constants import HOME_ENV_VAR
+
+
+def test_get_kubectl_version_from_env() -> None:
+    get_kubectl_version.cache_clear()
+    with patch.dict(os.environ, {"KUBECTL_VERSION": "v1.29.0"}), patch(
+        "paka.cluster.kubectl.get_latest_kubectl_version"
+    ) as mock_latest:
+        assert get_kubectl_version() == "v1.29.0"
+        mock_latest.assert_not_called()
+    get_kubectl_version.cache_clear()
+
+
+def test_get_latest_kubectl_version_is_cached(tmp_path: Path) -> None:
+    response = MagicMock()
+    response.text = "v1.30.1\n"
+
+    with patch.dict(os.environ, {HOME_ENV_VAR: str(tmp_path)}), patch(
+        "paka.cluster.kubectl.requests.get", return_value=response
+    ) as mock_get:
+        assert get_latest_kubectl_version() == "v1.30.1"
+        assert get_latest_kubectl_version() == "v1.30.1"
+        mock_get.assert_called_once()
+
+        # A stale cache is refreshed, and still used if the lookup fails
+        cache_file = tmp_path / "cache" / "kubectl-stable.txt"
+        stale = time.time() - KUBECTL_VERSION_CACHE_TTL - 1
+        os.utime(cache_file, (stale, stale))
+        mock_get.side_effect = requests.ConnectionError()
+        assert get_latest_kubectl_version() == "v1.30.1"
+        assert mock_get.call_count == 2
@@ -0,0 +1,20 @@
+from pulumi import ResourceOptions
+
+from paka.cluster.utils import strip_status
+
+
+def test_strip_status() -> None:
+    obj = {
+        "kind": "CustomResourceDefinition",
+        "metadata": {"name": "scaledobjects.keda.sh"},
+        "status": {"acceptedNames": {"kind": ""}, "storedVersions": []},
+    }
+    strip_status(obj, ResourceOptions())
+    assert obj == {
+        "kind": "CustomResourceDefinition",
+        "metadata": {"name": "scaledobjects.keda.sh"},
+    }
+
+    # Manifests without a status are left alone
+    strip_status(obj, ResourceOptions())
+    assert "metadata" in obj
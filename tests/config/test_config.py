@@ -120,6 +120,18 @@ def test_aws_model_group() -> None:
             runtime=Runtime(image="test-image"),
         )
 
+    # Test with maxInstances of 0
+    with pytest.raises(
+        ValueError, match="maxInstances must be greater than or equal to minInstances"
+    ):
+        AwsModelGroup(
+            name="test",
+            nodeType="c7i.xlarge",
+            minInstances=2,
+            maxInstances=0,
+            runtime=Runtime(image="test-image"),
+        )
+
     # Test with minInstances less than or equal to 0
     with pytest.raises(ValueError, match="minInstances must be greater than 0"):
         AwsModelGroup(
@@ -221,6 +233,20 @@ def test_cloud_config() -> None:
             vectorStore=vector_store,
         )
 
+    # Test with explicitly unset model groups
+    cloud_config = AwsConfig(cluster=cluster, modelGroups=None, mixedModelGroups=None)
+    assert cloud_config.modelGroups is None
+
+
+def test_cluster_config_is_frozen() -> None:
+    with pytest.raises(ValueError):
+        cloud_config.cluster.name = "another-cluster"  # type: ignore
+
+    with pytest.raises(ValueError):
+        cloud_config.modelGroups = []  # type: ignore
+
+    assert hash(cloud_config.cluster) == hash(cloud_config.cluster.model_copy())
+
 
 def test_config_only_aws_set() -> None:
     aws_config = cloud_config
@@ -300,6 +326,7 @@ def test_parse_yaml() -> None:
     assert config.aws.cluster.minNodes == 2
     assert config.aws.cluster.maxNodes == 4
     assert config.aws.cluster.logRetentionDays == 7
+    assert not config.aws.cluster.skipCheckpoints
     assert config.aws.modelGroups is not None
     assert len(config.aws.modelGroups) == 1
     model_group = config.aws.modelGroups[0]
@@ -378,6 +405,11 @@ def test_round_trip() -> None:
     assert original_config == parsed_config
 
 
+def test_parse_yaml_is_cached() -> None:
+    yaml_str = generate_yaml(Config(version="1.0", aws=cloud_config))
+    assert parse_yaml(yaml_str) is parse_yaml(yaml_str)
+
+
 def test_aws_yaml(snapshot: Any) -> None:
     original_config = Config(version="1.0", aws=cloud_config)
     yaml_str = generate_yaml(original_config)
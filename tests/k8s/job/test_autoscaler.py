@@ -0,0 +1,37 @@
+from unittest.mock import patch
+
+from paka.k8s.job.autoscaler import create_autoscaler
+
+
+def test_create_autoscaler() -> None:
+    with patch("paka.k8s.job.autoscaler.apply_resource") as mock_apply:
+        create_autoscaler(
+            namespace="default",
+            redis_svc_name="redis-master",
+            queue_name="celery",
+            trigger_queue_length=5,
+            job_name="job",
+            min_replicas=0,
+            max_replicas=5,
+        )
+
+        scaled_object = mock_apply.call_args.args[0]
+        assert scaled_object.metadata.name == "job"
+
+        spec = scaled_object.spec
+        assert spec["minReplicaCount"] == 0
+        assert spec["maxReplicaCount"] == 5
+        assert spec["pollingInterval"] == 10
+        assert spec["cooldownPeriod"] == 300
+
+        behavior = spec["advanced"]["horizontalPodAutoscalerConfig"]["behavior"]
+        assert behavior["scaleUp"]["stabilizationWindowSeconds"] == 60
+        assert behavior["scaleUp"]["policies"] == [
+            {"type": "Percent", "value": 100, "periodSeconds": 15}
+        ]
+        assert behavior["scaleDown"]["stabilizationWindowSeconds"] == 600
+
+        trigger = spec["triggers"][0]
+        assert trigger["useCachedMetrics"] is True
+        assert trigger["metadata"]["listName"] == "celery"
+        assert trigger["metadata"]["listLength"] == "5"
@@ -0,0 +1,46 @@
+from unittest.mock import patch
+
+import pytest
+
+from paka.k8s.job.worker import create_workers, get_trigger_queue_length
+
+
+def test_create_workers() -> None:
+    with patch("paka.k8s.job.worker.create_namespace"), patch(
+        "paka.k8s.job.worker.wait_for_pods_to_drain"
+    ) as mock_drain, patch(
+        "paka.k8s.job.worker.create_deployment"
+    ) as mock_deployment, patch(
+        "paka.k8s.job.worker.create_autoscaler"
+    ) as mock_autoscaler:
+        create_workers("default", "job", "image", "celery worker")
+
+        mock_drain.assert_called_once_with("default", "job")
+        mock_deployment.assert_called_once()
+        assert mock_autoscaler.call_args.kwargs["job_name"] == "job"
+        assert mock_autoscaler.call_args.kwargs["polling_interval_seconds"] == 10
+        assert mock_autoscaler.call_args.kwargs["cooldown_seconds"] == 300
+
+        # A failed apply is not swallowed
+        mock_autoscaler.side_effect = RuntimeError("boom")
+        with pytest.raises(RuntimeError, match="boom"):
+            create_workers("default", "job", "image", "celery worker")
+
+
+def test_get_trigger_queue_length() -> None:
+    assert get_trigger_queue_length(5) == 5
+    assert get_trigger_queue_length(5, 2, 30) == 60
+    assert get_trigger_queue_length(5, 0.5, 3) == 2
+    assert get_trigger_queue_length(5, 0.01, 1) == 1
+
+    # Only one of the two
+    with pytest.raises(ValueError):
+        get_trigger_queue_length(5, per_worker_throughput=2)
+    with pytest.raises(ValueError):
+        get_trigger_queue_length(5, cold_start_seconds=30)
+
+    # Not positive
+    with pytest.raises(ValueError):
+        get_trigger_queue_length(5, 0, 30)
+    with pytest.raises(ValueError):
+        get_trigger_queue_length(5, 2, -1)
@@ -1,9 +1,18 @@
+import json
+from typing import Any
 from unittest.mock import MagicMock, patch
 
+from kubernetes import client
 from kubernetes.client.exceptions import ApiException
 
 import paka.k8s.utils
-from paka.k8s.utils import KubeconfigMerger, KubernetesResource, apply_resource
+from paka.k8s.utils import (
+    KubeconfigMerger,
+    KubernetesResource,
+    apply_resource,
+    get_api_client,
+    get_core_v1_api,
+)
 
 
 def test_apply_resource() -> None:
@@ -16,8 +25,7 @@ def test_apply_resource() -> None:
     with patch("kubernetes.client.AppsV1Api") as mock_api_class:
         mock_api = mock_api_class.return_value
         mock_api.create_namespaced_deployment = MagicMock()
-        mock_api.replace_namespaced_deployment = MagicMock()
-        mock_api.read_namespaced_deployment = MagicMock(
+        mock_api.replace_namespaced_deployment = MagicMock(
             side_effect=ApiException(status=404)
         )
 
@@ -46,6 +54,9 @@ def test_apply_resource_existing() -> None:
         mock_api.replace_namespaced_deployment.assert_called_once_with(
             resource.metadata.name, resource.metadata.namespace, resource
         )
+        # No separate read before the update
+        mock_api.read_namespaced_deployment.assert_not_called()
+        mock_api.create_namespaced_deployment.assert_not_called()
 
 
 def test_apply_resource_scaled_object() -> None:
@@ -106,3 +117,45 @@ def test_kubeconfig_merger() -> None:
         "current-context": "context2",
         "other-key": "other-value2",
     }
+
+
+def test_get_core_v1_api() -> None:
+    kubeconfig_json = json.dumps({"apiVersion": "v1", "kind": "Config"})
+
+    def load(config_dict: Any) -> None:
+        configuration = client.Configuration()
+        configuration.host = "https://cluster-a"
+        client.Configuration.set_default(configuration)
+
+    try:
+        with patch(
+            "paka.k8s.utils.config.load_kube_config_from_dict", side_effect=load
+        ) as mock_load:
+            api = get_core_v1_api(kubeconfig_json)
+            mock_load.assert_called_once_with({"apiVersion": "v1", "kind": "Config"})
+
+            # The kubeconfig is the default, and the shared client is used
+            assert client.Configuration.get_default_copy().host == "https://cluster-a"
+            assert api.api_client is paka.k8s.utils.get_api_client()
+            assert api.api_client.configuration.host == "https://cluster-a"
+    finally:
+        client.Configuration.set_default(None)
+
+
+def test_get_api_client() -> None:
+    configuration = client.Configuration()
+    configuration.host = "https://cluster-a"
+    client.Configuration.set_default(configuration)
+
+    try:
+        api_client = get_api_client()
+        assert get_api_client() is api_client
+        assert api_client.configuration.host == "https://cluster-a"
+
+        # Loading another kubeconfig replaces the default configuration
+        configuration.host = "https://cluster-b"
+        client.Configuration.set_default(configuration)
+        assert get_api_client() is not api_client
+        assert get_api_client().configuration.host == "https://cluster-b"
+    finally:
+        client.Configuration.set_default(None)
@@ -0,0 +1,32 @@
+import time
+from typing import List
+
+from paka.logger import BufferedOutput
+
+
+def test_buffered_output_batches_lines() -> None:
+    logged: List[str] = []
+
+    with BufferedOutput(logged.append, max_lines=2, flush_interval=60) as output:
+        output("line 1")
+        output("line 2")
+        assert logged == ["line 1\nline 2"]
+
+        output("line 3")
+        assert logged == ["line 1\nline 2"]
+
+    # Leaving the context flushes the remaining lines
+    assert logged == ["line 1\nline 2", "line 3"]
+
+
+def test_buffered_output_flushes_after_interval() -> None:
+    logged: List[str] = []
+
+    output = BufferedOutput(logged.append, flush_interval=0.01)
+    output("line 1")
+
+    deadline = time.monotonic() + 5
+    while not logged and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    assert logged == ["line 1"]
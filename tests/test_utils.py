@@ -1,13 +1,26 @@
+import concurrent.futures
+import errno
+import io
 import json
 import os
+import tarfile
+import time
+from contextlib import contextmanager
 from pathlib import Path
+from typing import Generator
 from unittest.mock import mock_open, patch
 
+import pytest
+
 from paka.constants import HOME_ENV_VAR, PROJECT_NAME
 from paka.utils import (
+    calculate_sha256,
     call_once,
     camel_to_kebab,
     camel_to_snake,
+    download_cached_chart,
+    download_cached_url,
+    extract_tar_safely,
     get_cluster_data_dir,
     get_project_data_dir,
     kubify_name,
@@ -50,6 +63,63 @@ def test_call_once() -> None:
     assert counter == 1
 
 
+def test_call_once_reentrant() -> None:
+    calls = []
+
+    @call_once
+    def create() -> str:
+        calls.append(1)
+        # Reached again through its own call chain
+        assert create() is None
+        return "created"
+
+    assert create() == "created"
+    assert create() == "created"
+    assert len(calls) == 1
+
+
+def test_call_once_retries_after_failure() -> None:
+    calls = []
+
+    @call_once
+    def create() -> str:
+        calls.append(1)
+        if len(calls) == 1:
+            raise RuntimeError("boom")
+        return "created"
+
+    with pytest.raises(RuntimeError):
+        create()
+    assert create() == "created"
+    assert create() == "created"
+    assert len(calls) == 2
+
+
+def test_call_once_returns_first_result() -> None:
+    @call_once
+    def create() -> object:
+        return object()
+
+    assert create() is create()
+
+
+def test_call_once_concurrent_callers() -> None:
+    calls = 0
+
+    @call_once
+    def create() -> object:
+        nonlocal calls
+        calls += 1
+        time.sleep(0.05)
+        return object()
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(executor.map(lambda _: create(), range(4)))
+
+    assert calls == 1
+    assert all(result is results[0] for result in results)
+
+
 def test_to_yaml() -> None:
     obj = {"key": "value"}
     yaml_str = to_yaml(obj)
@@ -96,3 +166,132 @@ def test_camel_to_snake() -> None:
     assert camel_to_snake("IPV6Address") == "ipv6_address"
     assert camel_to_snake("noChange") == "no_change"
     assert camel_to_snake("") == ""
+
+
+def test_download_cached_url(tmp_path: Path) -> None:
+    downloaded = tmp_path / "downloaded"
+    downloaded.write_text("kind: List")
+
+    @contextmanager
+    def fake_download_url(url: str) -> Generator[str, None, None]:
+        yield str(downloaded)
+
+    url = "https://example.com/releases/v1.0.0/components.yaml"
+    with patch("paka.utils.download_url", side_effect=fake_download_url) as mock:
+        cached = download_cached_url(url, str(tmp_path / "cache"))
+        assert Path(cached).name == "components.yaml"
+        assert Path(cached).read_text() == "kind: List"
+
+        # The second call is served from the cache
+        assert download_cached_url(url, str(tmp_path / "cache")) == cached
+        mock.assert_called_once_with(url)
+
+        # A different URL gets its own cache entry
+        other = download_cached_url(
+            "https://example.com/releases/v1.0.1/components.yaml",
+            str(tmp_path / "cache"),
+        )
+        assert other != cached
+
+
+def test_download_cached_chart(tmp_path: Path) -> None:
+    archive = tmp_path / "mychart-1.0.0.tgz"
+    with tarfile.open(archive, "w:gz") as tar:
+        chart_yaml = b"name: mychart"
+        info = tarfile.TarInfo("mychart/Chart.yaml")
+        info.size = len(chart_yaml)
+        tar.addfile(info, io.BytesIO(chart_yaml))
+
+    index = f"""
+apiVersion: v1
+entries:
+  mychart:
+    - version: 1.1.0
+      urls: [https://example.com/charts/mychart-1.1.0.tgz]
+    - version: 1.0.0
+      digest: {calculate_sha256(str(archive))}
+      urls: [mychart-1.0.0.tgz]
+"""
+
+    @contextmanager
+    def fake_download_url(url: str) -> Generator[str, None, None]:
+        yield str(archive)
+
+    repo = "https://example.com/charts/"
+    cache_dir = str(tmp_path / "cache")
+    with patch("paka.utils.requests.get") as mock_get, patch(
+        "paka.utils.download_url", side_effect=fake_download_url
+    ) as mock_download:
+        mock_get.return_value.text = index
+
+        chart_dir = download_cached_chart(repo, "mychart", "1.0.0", cache_dir)
+        assert Path(chart_dir).name == "mychart"
+        assert (Path(chart_dir) / "Chart.yaml").read_text() == "name: mychart"
+        mock_get.assert_called_once_with("https://example.com/charts/index.yaml")
+        # Relative archive URLs are resolved against the repository
+        mock_download.assert_called_once_with(
+            "https://example.com/charts/mychart-1.0.0.tgz"
+        )
+
+        # The unpacked chart is reused without reading the index again
+        assert download_cached_chart(repo, "mychart", "1.0.0", cache_dir) == chart_dir
+        mock_get.assert_called_once()
+        mock_download.assert_called_once()
+
+        with pytest.raises(Exception, match="not found"):
+            download_cached_chart(repo, "mychart", "2.0.0", cache_dir)
+
+
+def test_download_cached_chart_race(tmp_path: Path) -> None:
+    archive = tmp_path / "mychart-1.0.0.tgz"
+    with tarfile.open(archive, "w:gz") as tar:
+        info = tarfile.TarInfo("mychart/Chart.yaml")
+        tar.addfile(info, io.BytesIO(b""))
+
+    @contextmanager
+    def fake_download_url(url: str) -> Generator[str, None, None]:
+        yield str(archive)
+
+    def concurrent_replace(src: str, dst: str) -> None:
+        # Another run unpacks the chart in the meantime
+        os.makedirs(os.path.join(dst, "mychart"))
+        raise OSError(errno.ENOTEMPTY, "Directory not empty")
+
+    cache_dir = tmp_path / "cache"
+    with patch("paka.utils.requests.get") as mock_get, patch(
+        "paka.utils.download_url", side_effect=fake_download_url
+    ), patch("paka.utils.os.replace", side_effect=concurrent_replace):
+        mock_get.return_value.text = (
+            "entries: {mychart: [{version: 1.0.0, urls: [mychart-1.0.0.tgz]}]}"
+        )
+
+        chart_dir = download_cached_chart(
+            "https://example.com/charts", "mychart", "1.0.0", str(cache_dir)
+        )
+        assert Path(chart_dir).is_dir()
+        # The temporary directory is cleaned up
+        assert [p.name for p in Path(chart_dir).parent.parent.iterdir()] == [
+            "mychart-1.0.0"
+        ]
+
+
+def test_extract_tar_safely(tmp_path: Path) -> None:
+    archive = tmp_path / "evil.tgz"
+    with tarfile.open(archive, "w:gz") as tar:
+        tar.addfile(tarfile.TarInfo("../evil"), io.BytesIO(b""))
+
+    target = tmp_path / "target"
+    target.mkdir()
+    with tarfile.open(archive, "r:gz") as tar:
+        with pytest.raises(Exception):
+            extract_tar_safely(tar, str(target))
+    assert not (tmp_path / "evil").exists()
+
+    # Without extraction filters
+    with tarfile.open(archive, "r:gz") as tar, patch.object(
+        tarfile, "data_filter", create=True
+    ):
+        delattr(tarfile, "data_filter")
+        with pytest.raises(Exception, match="Refusing"):
+            extract_tar_safely(tar, str(target))
+    assert not (tmp_path / "evil").exists()